@@ -0,0 +1,123 @@
+"""Round trips and wall time of per-message vs batched Gmail fetches, on a fake API."""
+
+import base64
+import sys
+import time
+from typing import Callable, Optional
+
+from src.models.config import RateLimitConfig
+from src.services.gmail_service import GmailService
+from src.utils.rate_limiter import RateLimiter
+
+
+class FakeRequest:
+    """A request whose execute() costs one simulated HTTP round trip."""
+
+    def __init__(self, api: "FakeGmailApi", respond: Callable[[], dict], params: Optional[dict] = None):
+        """Initialize request with its API, response factory and call parameters."""
+        self.api = api
+        self.respond = respond
+        self.params = params or {}
+
+    def execute(self) -> dict:
+        """Return the response after one round trip."""
+        self.api.round_trip()
+        return self.respond()
+
+
+class FakeBatch:
+    """A batch request: any number of requests in one round trip."""
+
+    def __init__(self, api: "FakeGmailApi", callback: Callable):
+        """Initialize batch with the per-request callback."""
+        self.api = api
+        self.callback = callback
+        self.requests: list[tuple[str, FakeRequest]] = []
+
+    def add(self, request: FakeRequest, request_id: Optional[str] = None) -> None:
+        """Queue a request in the batch."""
+        self.requests.append((request_id or str(len(self.requests)), request))
+
+    def execute(self) -> None:
+        """Answer every queued request after one round trip."""
+        self.api.round_trip()
+        for request_id, request in self.requests:
+            self.callback(request_id, request.respond(), None)
+
+
+class FakeGmailApi:
+    """Minimal users().messages() resource over a mailbox of generated messages."""
+
+    def __init__(self, count: int, latency_ms: float):
+        """Initialize the mailbox with count messages and a per-round-trip latency."""
+        self.ids = [f"msg-{i:06d}" for i in range(count)]
+        self.latency = latency_ms / 1000
+        self.round_trips = 0
+
+    def round_trip(self) -> None:
+        """Count one HTTP round trip and wait out its latency."""
+        self.round_trips += 1
+        time.sleep(self.latency)
+
+    def users(self) -> "FakeGmailApi":
+        """The users() collection (this object)."""
+        return self
+
+    def messages(self) -> "FakeGmailApi":
+        """The messages() collection (this object)."""
+        return self
+
+    def list(self, userId: str, maxResults: int, pageToken: int = 0, **query) -> FakeRequest:
+        """One page of message IDs."""
+        def respond() -> dict:
+            page = {"messages": [{"id": i} for i in self.ids[pageToken:pageToken + maxResults]]}
+            if pageToken + maxResults < len(self.ids):
+                page["nextPageToken"] = pageToken + maxResults
+            return page
+        return FakeRequest(self, respond, {"maxResults": maxResults, **query})
+
+    def list_next(self, request: FakeRequest, response: dict) -> Optional[FakeRequest]:
+        """Request for the following page, or None after the last one."""
+        if "nextPageToken" not in response:
+            return None
+        return self.list("me", pageToken=response["nextPageToken"], **request.params)
+
+    def get(self, userId: str, id: str, format: str, metadataHeaders=None) -> FakeRequest:
+        """One message resource."""
+        body = base64.urlsafe_b64encode(b"Meeting tomorrow at 2pm").decode()
+        return FakeRequest(self, lambda: {
+            "id": id,
+            "labelIds": ["INBOX", "UNREAD"],
+            "payload": {
+                "mimeType": "text/plain",
+                "headers": [{"name": "From", "value": "a@example.com"},
+                            {"name": "Subject", "value": f"Sync {id}"}],
+                "body": {"data": body},
+            },
+        })
+
+    def new_batch_http_request(self, callback: Callable) -> FakeBatch:
+        """Start a batch request."""
+        return FakeBatch(self, callback)
+
+
+def run_benchmark(count: int = 200, latency_ms: float = 10.0) -> None:
+    """Fetch count messages per-message and in batches, printing round trips and time."""
+    # Quota is not what is measured, so the limiter never waits
+    limiter = RateLimiter(RateLimitConfig(gmail_units_per_second=1e9))
+    print(f"Fetching {count} messages ({latency_ms:g} ms per round trip):")
+    for label, batch_size in (("per message", 1), ("batched (50)", 50), ("batched (100)", 100)):
+        gmail = GmailService(batch_size=batch_size, rate_limiter=limiter)
+        gmail.service = FakeGmailApi(count, latency_ms)
+        started = time.perf_counter()
+        fetched = len(gmail.get_emails(max_results=count))
+        elapsed = time.perf_counter() - started
+        print(f"  {label:<16} {gmail.service.round_trips:6d} round trips "
+              f"{elapsed:8.2f} s  ({fetched} emails)")
+
+
+if __name__ == '__main__':
+    run_benchmark(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 10.0,
+    )
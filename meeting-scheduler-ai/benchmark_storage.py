@@ -0,0 +1,77 @@
+"""Microbenchmark of per-email storage overhead (is_processed + mark_as_processed)."""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from src.utils.storage import EmailStorage, ProcessedRecord
+
+
+def connect_per_call(db_path: str, email_id: str) -> None:
+    """The previous storage pattern: a fresh connection and commit per statement."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("SELECT 1 FROM processed_emails WHERE email_id = ?", (email_id,)).fetchone()
+    conn.close()
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT OR REPLACE INTO processed_emails VALUES (?, ?, ?, ?, ?, ?)",
+        (email_id, "Subject", "sender@example.com", datetime.utcnow().isoformat(), 0, None)
+    )
+    conn.commit()
+    conn.close()
+
+
+def shared_connection(storage: EmailStorage, email_id: str) -> None:
+    """The current storage pattern: one check and one write on the shared connection."""
+    storage.is_processed(email_id)
+    storage.mark_as_processed(email_id, False, "Subject", "sender@example.com")
+
+
+def time_per_email(label: str, count: int, step) -> None:
+    """Run step for count emails and print the mean cost per email."""
+    started = time.perf_counter()
+    step(count)
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<32} {elapsed / count * 1e6:10.1f} us/email")
+
+
+def run_benchmark(count: int = 2000) -> None:
+    """Compare connect-per-call, a shared connection, one transaction and the bulk APIs."""
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_db = str(Path(tmp) / "legacy.db")
+        EmailStorage(legacy_db).close()
+        # The old code ran with SQLite's default rollback journal
+        sqlite3.connect(legacy_db).execute("PRAGMA journal_mode=DELETE").close()
+
+        storage = EmailStorage(str(Path(tmp) / "shared.db"))
+        print(f"Storage overhead per email ({count} emails):")
+        time_per_email("connect per call", count, lambda n: [
+            connect_per_call(legacy_db, f"legacy-{i}") for i in range(n)
+        ])
+        time_per_email("shared connection", count, lambda n: [
+            shared_connection(storage, f"shared-{i}") for i in range(n)
+        ])
+
+        def batched(n: int) -> None:
+            with storage.transaction():
+                for i in range(n):
+                    shared_connection(storage, f"batched-{i}")
+
+        time_per_email("shared connection, one commit", count, batched)
+
+        def bulk(n: int) -> None:
+            pending = storage.filter_unprocessed(f"bulk-{i}" for i in range(n))
+            storage.mark_many(
+                ProcessedRecord(email_id, False, "Subject", "sender@example.com")
+                for email_id in pending
+            )
+
+        time_per_email("filter_unprocessed + mark_many", count, bulk)
+        storage.close()
+
+
+if __name__ == '__main__':
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
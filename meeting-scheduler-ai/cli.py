@@ -11,6 +11,7 @@ from src.utils.config_loader import load_environment_variables, load_config
 from src.utils.logger import setup_logger
 from src.agent import MeetingAgent
 from src.scheduler import AgentScheduler
+from src.utils.retention import RetentionManager
 from src.utils.storage import EmailStorage
 
 
@@ -101,6 +102,58 @@ def stats(config: str):
         click.echo("\n=== Processing Statistics ===")
         click.echo(f"Total emails processed: {stats_data['total_processed']}")
         click.echo(f"Meetings created: {stats_data['meetings_created']}")
+        if stats_data["failure_reasons"]:
+            click.echo("Not created, by reason:")
+            for reason, count in stats_data["failure_reasons"].items():
+                click.echo(f"  {reason}: {count}")
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--config",
+    default="config.yaml",
+    help="Path to configuration file",
+)
+@click.option(
+    "--days",
+    type=int,
+    default=None,
+    help="Archive emails processed more than this many days ago (default: storage.retention_days)",
+)
+def compact(config: str, days: int):
+    """Archive old processed emails and reclaim free database space."""
+    load_environment_variables()
+    app_config = load_config(config)
+    storage = app_config.storage
+
+    try:
+        retention = RetentionManager(
+            storage.database_path,
+            storage.retention_days if days is None else days,
+            storage.archive_batch_size,
+        )
+        before = retention.space_report()
+        archived = 0
+        while (moved := retention.archive_batch()):
+            archived += moved
+        if retention.enable_incremental_vacuum():
+            click.echo("Enabled incremental auto-vacuum (full VACUUM run once)")
+        while retention.reclaim():
+            pass
+        retention.checkpoint()
+        after = retention.space_report()
+
+        click.echo("\n=== Storage Compaction ===")
+        click.echo(f"Rows archived: {archived}")
+        click.echo(f"Hot rows: {after['hot_rows']}, tombstones: {after['tombstones']}, "
+                   f"archived: {after['archived_rows']} ({after['archive_bytes'] / 1024:.1f} KB)")
+        click.echo(f"Database size: {before['file_bytes'] / 1024:.1f} KB -> "
+                   f"{after['file_bytes'] / 1024:.1f} KB")
+        click.echo(f"Space reclaimed: {(before['file_bytes'] - after['file_bytes']) / 1024:.1f} KB")
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -118,7 +171,12 @@ def stats(config: str):
     default="EMAIL_REPORT.md",
     help="Output file path for the report",
 )
-def report(config: str, output: str):
+@click.option(
+    "--include-archived",
+    is_flag=True,
+    help="Also list emails moved to the archive by retention",
+)
+def report(config: str, output: str, include_archived: bool):
     """Generate markdown report of processed emails."""
     load_environment_variables()
     app_config = load_config(config)
@@ -144,6 +202,12 @@ def report(config: str, output: str):
         rows = cursor.fetchall()
         conn.close()
 
+        if include_archived:
+            retention = RetentionManager(db_path)
+            rows += [tuple(row.values()) for row in retention.iter_archived()]
+            retention.close()
+            rows.sort(key=lambda row: row[3], reverse=True)
+
         if not rows:
             click.echo("No processed emails found in database.")
             sys.exit(0)
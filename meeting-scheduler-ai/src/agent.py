@@ -1,14 +1,27 @@
 """Main agent orchestration."""
 
 import logging
-from typing import Optional
 
+from src.components import (
+    build_classifier,
+    build_duplicate_router,
+    build_extraction_cache,
+    build_provider_pool,
+    build_storage,
+    collect_counters,
+)
+from src.email_processor import EmailProcessor
+from src.mailbox import MailboxReader
+from src.meeting_writer import MeetingWriter
 from src.models.config import AppConfig
+from src.replay.google import attach_google_fixtures
 from src.services.gmail_service import GmailService
 from src.services.calendar_service import CalendarService
 from src.services.llm_service import LLMService
+from src.utils.calendar_store import CalendarStore
 from src.utils.email_filter import filter_emails
-from src.utils.storage import EmailStorage
+from src.utils.rate_limiter import RateLimiter
+from src.utils.storage import ProcessedRecord
 
 
 class MeetingAgent:
@@ -19,19 +32,49 @@ class MeetingAgent:
         self.config = config
         self.logger = logger
 
-        # Initialize services
-        self.gmail_service = GmailService()
-        self.calendar_service = CalendarService()
-        self.llm_service = LLMService(config.llm)
-        self.storage = EmailStorage(config.storage.database_path)
+        # Initialize services sharing one client-side rate limiter
+        self.rate_limiter = RateLimiter(config.rate_limits)
+        self.gmail_service = GmailService(
+            batch_size=config.gmail.batch_size, rate_limiter=self.rate_limiter
+        )
+        self.calendar_service = CalendarService(
+            rate_limiter=self.rate_limiter,
+            batch_size=config.calendar.batch_size,
+            mirror_window_days=config.calendar.mirror_window_days,
+            event_store=CalendarStore(config.storage.database_path)
+            if config.calendar.sync_mirror else None,
+        )
+        self.llm_service = LLMService(
+            config.llm, self.rate_limiter, build_extraction_cache(config),
+            build_provider_pool(config, self.rate_limiter),
+        )
+        self.storage = build_storage(config)
+        self.mailbox = MailboxReader(config, self.gmail_service, self.storage)
+        self.writer = MeetingWriter(
+            config, self.calendar_service, self.storage, self.mailbox, logger
+        )
+        self.classifier = build_classifier(config)
+        self.duplicates = build_duplicate_router(config, self.storage, logger)
+        self.processor = EmailProcessor(
+            config, self.llm_service, self.storage, self.writer, logger,
+            self.classifier, self.duplicates,
+        )
 
     def authenticate_services(self) -> None:
         """Authenticate all Google services."""
+        replay = self.config.replay
+        if replay.mode == "replay":
+            self.logger.info(f"Replaying Google API responses from {replay.fixtures_dir}")
+            attach_google_fixtures(replay, self.gmail_service, self.calendar_service)
+            return
+
         self.logger.info("Authenticating Gmail service...")
         self.gmail_service.authenticate()
 
         self.logger.info("Authenticating Calendar service...")
         self.calendar_service.authenticate()
+        if replay.mode == "record":
+            attach_google_fixtures(replay, self.gmail_service, self.calendar_service)
 
     def run(self) -> dict:
         """Execute one cycle of email processing."""
@@ -40,98 +83,67 @@ class MeetingAgent:
         stats = {
             "emails_checked": 0,
             "emails_filtered": 0,
+            "emails_classified_out": 0,
+            "prompt_bytes_saved": 0,
+            "calendar_invites": 0,
+            "near_duplicates": 0,
             "meetings_created": 0,
             "errors": 0,
         }
 
         try:
-            # Fetch emails
-            emails = self.gmail_service.get_emails(
-                max_results=self.config.agent.max_emails_per_run
-            )
-            stats["emails_checked"] = len(emails)
-            self.logger.info(f"Fetched {len(emails)} emails")
-
-            # Filter emails
-            filtered_emails = filter_emails(emails, self.config.gmail.filters)
-            stats["emails_filtered"] = len(filtered_emails)
-            self.logger.info(f"Filtered to {len(filtered_emails)} emails")
-
-            # Track emails that didn't match filters
-            filtered_ids = {email.id for email in filtered_emails}
-            for email in emails:
-                if email.id not in filtered_ids and not self.storage.is_processed(email.id):
-                    self.storage.mark_as_processed(
-                        email.id,
-                        False,
-                        email.subject,
-                        email.sender,
-                        "Did not match filter criteria (subject keywords)"
-                    )
-
-            # Process each email
-            for email in filtered_emails:
-                try:
-                    self._process_email(email, stats)
-                except Exception as e:
-                    self.logger.error(f"Error processing email {email.id}: {e}")
-                    stats["errors"] += 1
+            # Reload calendar events for duplicate checks, and sync the local copy, once per run
+            self.calendar_service.clear_mirrors()
+            if self.config.calendar.sync_mirror:
+                self.calendar_service.sync_event_store(self.config.calendar.calendar_id)
+
+            # Stream emails in batches so extraction starts on the first page
+            # Each batch's outcomes are written together, so a crash loses at most one batch
+            for emails in self.mailbox.iter_batches():
+                with self.storage.deferred_writes():
+                    self._process_batch(emails, stats)
+            self.writer.flush(stats)
+
+            for email_id, error in self.mailbox.flush_read_queue().items():
+                self.logger.warning(f"Could not mark email {email_id} as read: {error}")
+            self.mailbox.save_checkpoint()
 
         except Exception as e:
             self.logger.error(f"Agent run failed: {e}")
             stats["errors"] += 1
+        self.llm_service.pool.close()
 
+        stats.update(collect_counters(
+            self.rate_limiter, self.llm_service, self.storage, self.classifier, self.duplicates
+        ))
         self.logger.info(f"Agent run completed: {stats}")
         return stats
 
-    def _process_email(self, email, stats: dict) -> None:
-        """Process a single email."""
-        # Skip if already processed
-        if self.storage.is_processed(email.id):
-            self.logger.debug(f"Email {email.id} already processed, skipping")
-            return
-
-        self.logger.info(f"Processing email: {email.subject}")
+    def _process_batch(self, emails: list, stats: dict) -> None:
+        """Filter, track and process one streamed batch of emails."""
+        stats["emails_checked"] += len(emails)
 
-        # Extract meeting info using LLM
-        meeting = self.llm_service.extract_meeting_info(
-            email.subject,
-            email.get_plain_text_body(),
-            self.config.calendar.default_duration_minutes,
+        # Filter emails
+        filtered_emails = filter_emails(emails, self.config.gmail.filters)
+        stats["emails_filtered"] += len(filtered_emails)
+        self.logger.info(
+            f"Fetched {len(emails)} emails, {len(filtered_emails)} matched filters"
         )
 
-        if not meeting or not meeting.is_valid():
-            self.logger.warning(f"Could not extract valid meeting from email {email.id}")
-            self.storage.mark_as_processed(
-                email.id,
-                False,
-                email.subject,
-                email.sender,
-                "Could not extract valid meeting information (missing date/time)"
-            )
-            return
-
-        # Add email reference to description
-        meeting.description = f"{meeting.description}\n\nSource: {email.subject}"
+        # One lookup for the whole batch; processed emails are not handled again
+        unprocessed = set(self.storage.filter_unprocessed(email.id for email in emails))
+        filtered_ids = {email.id for email in filtered_emails}
 
-        # Create calendar event
-        event_id = self.calendar_service.create_event(
-            meeting,
-            self.config.calendar.calendar_id
+        # Track emails that didn't match filters
+        reason = "Did not match filter criteria (subject keywords)"
+        self.storage.mark_many(
+            ProcessedRecord(email.id, False, email.subject, email.sender, reason)
+            for email in emails if email.id in unprocessed and email.id not in filtered_ids
         )
+        filtered_emails = [email for email in filtered_emails if email.id in unprocessed]
 
-        self.logger.info(f"Created calendar event {event_id} for meeting: {meeting.subject}")
-        stats["meetings_created"] += 1
-
-        # Mark as processed
-        self.storage.mark_as_processed(
-            email.id,
-            True,
-            email.subject,
-            email.sender,
-            None
-        )
+        # Download full bodies for the survivors (two-phase fetch)
+        filtered_emails = self.mailbox.fetch_bodies(filtered_emails)
 
-        # Mark email as read if configured
-        if self.config.agent.mark_as_read_after_processing:
-            self.gmail_service.mark_as_read(email.id)
+        # Extract and record meetings, isolating failures per email
+        self.processor.process_batch(filtered_emails, stats)
@@ -0,0 +1,89 @@
+"""Construction of the optional agent components enabled in configuration."""
+
+import logging
+from typing import Optional
+
+from src.duplicate_router import DuplicateRouter
+from src.models.config import AppConfig
+from src.services.llm_providers import ProviderPool
+from src.services.llm_service import LLMService
+from src.utils.extraction_cache import ExtractionCache
+from src.utils.meeting_classifier import MeetingClassifier
+from src.utils.near_duplicates import NearDuplicateIndex
+from src.utils.rate_limiter import RateLimiter
+from src.utils.storage import EmailStorage
+
+
+def build_extraction_cache(config: AppConfig) -> Optional[ExtractionCache]:
+    """Create the LLM extraction cache if it is enabled."""
+    llm = config.llm
+    if not llm.cache_enabled:
+        return None
+    return ExtractionCache(
+        config.storage.database_path,
+        ttl_seconds=llm.cache_ttl_hours * 3600,
+        max_entries=llm.cache_max_entries,
+        memory_entries=llm.cache_memory_entries,
+    )
+
+
+def build_classifier(config: AppConfig) -> Optional[MeetingClassifier]:
+    """Create the local meeting pre-classifier if it is enabled."""
+    classifier = config.classifier
+    if not classifier.enabled:
+        return None
+    if classifier.weights_path:
+        return MeetingClassifier.from_file(classifier.weights_path, classifier.threshold)
+    return MeetingClassifier(classifier.threshold)
+
+
+def build_duplicate_router(
+    config: AppConfig, storage: EmailStorage, logger: logging.Logger
+) -> Optional[DuplicateRouter]:
+    """Create the near-duplicate router if it is enabled."""
+    near = config.near_duplicates
+    if not near.enabled:
+        return None
+    index = NearDuplicateIndex(
+        config.storage.database_path, near.threshold, near.num_perm, near.bands
+    )
+    return DuplicateRouter(config, index, storage, logger)
+
+
+def build_provider_pool(config: AppConfig, rate_limiter: RateLimiter) -> Optional[ProviderPool]:
+    """Create an LLM provider pool on recorded clients when replay is active."""
+    if config.replay.mode == "off":
+        return None
+    from src.replay.llm import client_factories
+    client_factory, async_client_factory = client_factories(config.replay)
+    return ProviderPool(config.llm, rate_limiter, client_factory, async_client_factory)
+
+
+def build_storage(config: AppConfig) -> EmailStorage:
+    """Create processed-email storage, with the Bloom filter index if enabled."""
+    storage = config.storage
+    return EmailStorage(
+        storage.database_path, storage.bloom_error_rate if storage.processed_index else None
+    )
+
+
+def collect_counters(rate_limiter: RateLimiter, llm_service: LLMService, storage: EmailStorage,
+                     classifier: Optional[MeetingClassifier],
+                     duplicates: Optional[DuplicateRouter]) -> dict:
+    """Counters of the shared services and of each enabled component, for run stats."""
+    counters = {
+        "rate_limits": rate_limiter.get_counters(),
+        "extraction_paths": dict(llm_service.paths),
+        "llm_providers": llm_service.pool.get_counters(),
+    }
+    optional = {
+        "near_duplicate_index": duplicates.index if duplicates else None,
+        "classifier": classifier,
+        "llm_cache": llm_service.cache,
+        "processed_index": storage.index,
+    }
+    counters.update({
+        name: component.get_counters() for name, component in optional.items()
+        if component is not None
+    })
+    return counters
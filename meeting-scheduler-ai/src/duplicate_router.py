@@ -0,0 +1,56 @@
+"""Routing of near-duplicate emails away from extraction."""
+
+import logging
+
+from src.models.config import AppConfig
+from src.models.email import Email
+from src.utils.body_compactor import compact_body
+from src.utils.near_duplicates import NearDuplicateIndex
+from src.utils.storage import EmailStorage
+
+
+class DuplicateRouter:
+    """Holds back emails that nearly repeat one already sent for extraction.
+
+    A duplicate reuses the outcome of the email it repeats: no extraction
+    and no second calendar event. Emails whose date/time lines changed
+    (reschedules) are not duplicates and take the normal path.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        index: NearDuplicateIndex,
+        storage: EmailStorage,
+        logger: logging.Logger,
+    ):
+        """Initialize router with configuration, index and storage."""
+        self.config = config
+        self.index = index
+        self.storage = storage
+        self.logger = logger
+        self._duplicates: dict[str, str] = {}
+
+    def route(self, emails: list[Email], stats: dict) -> list[Email]:
+        """Return the emails that still need extraction, indexing each of them."""
+        remaining = []
+        for email in emails:
+            text = f"{email.subject}\n{compact_body(email.get_plain_text_body(), 0)}"
+            original = self.index.find_or_add(email.id, text)
+            if original:
+                self._duplicates[email.id] = original
+                stats["near_duplicates"] += 1
+            else:
+                remaining.append(email)
+        return remaining
+
+    def resolve(self, email: Email) -> bool:
+        """Record a held-back duplicate as processed; False for any other email."""
+        original = self._duplicates.pop(email.id, None)
+        if original is None:
+            return False
+        self.logger.info(f"Email {email.id} nearly duplicates email {original}, skipping")
+        self.storage.mark_as_processed(
+            email.id, False, email.subject, email.sender, f"Near-duplicate of email {original}"
+        )
+        return True
@@ -0,0 +1,149 @@
+"""Meeting extraction for individual filtered emails."""
+
+import logging
+from typing import Callable, Optional, TypeVar
+
+from src.duplicate_router import DuplicateRouter
+from src.meeting_writer import MeetingWriter
+from src.models.config import AppConfig
+from src.models.email import Email
+from src.models.meeting import Meeting
+from src.services.ics_parser import read_invites
+from src.services.llm_service import LLMService
+from src.utils.body_compactor import compact_body
+from src.utils.meeting_classifier import MeetingClassifier
+from src.utils.storage import EmailStorage
+
+T = TypeVar("T")
+
+
+class EmailProcessor:
+    """Extracts a meeting from an email and hands it to the meeting writer."""
+
+    def __init__(
+        self,
+        config: AppConfig,
+        llm_service: LLMService,
+        storage: EmailStorage,
+        writer: MeetingWriter,
+        logger: logging.Logger,
+        classifier: Optional[MeetingClassifier] = None,
+        duplicates: Optional[DuplicateRouter] = None,
+    ):
+        """Initialize processor with configuration, services and storage."""
+        self.config = config
+        self.llm_service = llm_service
+        self.storage = storage
+        self.writer = writer
+        self.logger = logger
+        self.classifier = classifier
+        self.duplicates = duplicates
+
+    def process_batch(self, emails: list[Email], stats: dict) -> None:
+        """Extract meetings for a batch of unprocessed emails and record each outcome.
+
+        Extraction may run concurrently; outcomes are handled (and each email
+        logged with its outcome) one at a time in the original email order.
+        Every step runs per email with its error captured, so a failure only
+        affects its own email.
+        """
+        duration = self.config.calendar.default_duration_minutes
+        failed: dict[str, Exception] = {}
+
+        # Attached calendar invites are read directly and skip the LLM
+        read = self._isolated(emails, lambda e: read_invites([e], duration), failed)
+        invites = {key: meeting for found in read.values() for key, meeting in found.items()}
+        stats["calendar_invites"] += sum(meeting is not None for meeting in invites.values())
+        prompts = self._isolated(
+            [e for e in emails if e.id not in invites and e.id not in failed],
+            lambda e: self._prompt_for(e, stats), failed,
+        )
+        prompts = {email_id: prompt for email_id, prompt in prompts.items() if prompt}
+
+        # Extract meeting info using LLM
+        try:
+            results = self.llm_service.extract_many(list(prompts.values()), duration)
+        except Exception as e:
+            results = [e] * len(prompts)
+        extracted = {**dict(zip(prompts, results)), **failed}
+
+        for email in emails:
+            self.logger.info(f"Processing email: {email.subject}")
+            try:
+                if self.duplicates and self.duplicates.resolve(email):
+                    continue
+                if email.id in invites:
+                    self._handle_invite(email, invites[email.id], stats)
+                    continue
+                if email.id not in extracted:
+                    continue
+                result = extracted[email.id]
+                if isinstance(result, Exception):
+                    raise result
+                if self.config.classifier.shadow_mode and self.classifier:
+                    self.classifier.record(
+                        self.classifier.is_meeting(email), bool(result and result.is_valid())
+                    )
+                self._handle_meeting(email, result, stats)
+            except Exception as e:
+                self.logger.error(f"Error processing email {email.id}: {e}")
+                stats["errors"] += 1
+
+    @staticmethod
+    def _isolated(emails: list[Email], step: Callable[[Email], T], failed: dict) -> dict[str, T]:
+        """Run step per email, keyed by email ID; an email whose step raised goes to failed."""
+        results = {}
+        for email in emails:
+            try:
+                results[email.id] = step(email)
+            except Exception as e:
+                failed[email.id] = e
+        return results
+
+    def _handle_invite(self, email: Email, meeting: Optional[Meeting], stats: dict) -> None:
+        """Record a meeting read from an invite, or skip a cancellation."""
+        if meeting is None:
+            self.logger.info(f"Email {email.id} cancels a meeting, nothing to create")
+            self.storage.mark_as_processed(
+                email.id, False, email.subject, email.sender, "Calendar invite cancellation"
+            )
+            return
+        self._handle_meeting(email, meeting, stats)
+
+    def _prompt_for(self, email: Email, stats: dict) -> Optional[tuple[str, str]]:
+        """(subject, body) to send to the LLM, or None if classified out or a near-duplicate."""
+        if self.classifier and not self.config.classifier.shadow_mode:
+            score = self.classifier.score(email)
+            if score < self.classifier.threshold:
+                self.logger.info(f"Skipping email {email.id}: meeting score {score:.2f}")
+                stats["emails_classified_out"] += 1
+                reason = f"Classified as not a meeting (score {score:.2f})"
+                self.storage.mark_as_processed(email.id, False, email.subject, email.sender, reason)
+                return None
+        if self.duplicates and not self.duplicates.route([email], stats):
+            return None
+        body = email.get_plain_text_body()
+        if self.config.llm.compact_bodies:
+            compacted = compact_body(body, self.config.llm.body_token_budget)
+            stats["prompt_bytes_saved"] += len(body.encode()) - len(compacted.encode())
+            body = compacted
+        return email.subject, body
+
+    def _handle_meeting(self, email: Email, meeting: Optional[Meeting], stats: dict) -> None:
+        """Record an extraction result for one email."""
+        if not meeting or not meeting.is_valid():
+            self.logger.warning(f"Could not extract valid meeting from email {email.id}")
+            self.storage.mark_as_processed(
+                email.id,
+                False,
+                email.subject,
+                email.sender,
+                "Could not extract valid meeting information (missing date/time)"
+            )
+            return
+
+        # Add email reference to description
+        meeting.description = f"{meeting.description}\n\nSource: {email.subject}"
+
+        # Create calendar event (or queue it for the end-of-run batch)
+        self.writer.write(email, meeting, stats)
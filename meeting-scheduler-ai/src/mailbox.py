@@ -0,0 +1,101 @@
+"""Mailbox reading for agent runs."""
+
+import json
+from itertools import islice
+from typing import Iterator, Optional
+
+from src.models.config import AppConfig
+from src.models.email import Email
+from src.services.gmail_service import GmailService
+from src.utils.gmail_query import compile_gmail_query
+from src.utils.storage import EmailStorage
+
+GMAIL_HISTORY_KEY = "gmail_history_id"
+# Emails an incremental run fetched but did not finish; fetched again next run
+GMAIL_RETRY_KEY = "gmail_retry_ids"
+
+
+class MailboxReader:
+    """Fetches the emails an agent run should look at and updates their read state."""
+
+    def __init__(self, config: AppConfig, gmail_service: GmailService, storage: EmailStorage):
+        """Initialize reader with configuration, Gmail service and storage."""
+        self.config = config
+        self.gmail_service = gmail_service
+        self.storage = storage
+        self._pending_history_id: Optional[str] = None
+        self._read_queue: list[str] = []
+        self._seen_ids: list[str] = []
+
+    def iter_batches(self) -> Iterator[list[Email]]:
+        """Stream the emails for this run in chunks of gmail.batch_size.
+
+        In two-phase mode only headers and labels are fetched; call
+        fetch_bodies on the emails that survive filtering.
+        """
+        emails = self._open_stream()
+        chunk_size = max(self.config.gmail.batch_size, 1)
+
+        while True:
+            chunk = list(islice(emails, chunk_size))
+            if not chunk:
+                return
+            self._seen_ids.extend(email.id for email in chunk)
+            yield chunk
+
+    def _open_stream(self) -> Iterator[Email]:
+        """Start the email stream for the configured sync mode."""
+        self._seen_ids = []
+        gmail = self.config.gmail
+        max_results = self.config.agent.max_emails_per_run
+        query = compile_gmail_query(gmail.filters) if gmail.server_side_filters else None
+
+        if gmail.sync_mode != "incremental":
+            return self.gmail_service.iter_emails(
+                query, gmail.page_size, max_results, gmail.two_phase_fetch
+            )
+
+        emails, self._pending_history_id = self.gmail_service.sync_emails(
+            self.storage.get_sync_state(GMAIL_HISTORY_KEY),
+            max_results,
+            query,
+            gmail.two_phase_fetch,
+            gmail.page_size,
+            json.loads(self.storage.get_sync_state(GMAIL_RETRY_KEY) or "[]"),
+        )
+        return emails
+
+    def fetch_bodies(self, emails: list[Email]) -> list[Email]:
+        """Download full bodies for (unprocessed) emails in two-phase mode."""
+        if not self.config.gmail.two_phase_fetch:
+            return emails
+
+        return self.gmail_service.fetch_bodies(emails)
+
+    def save_checkpoint(self) -> None:
+        """Persist the sync checkpoint reached by the last fetch.
+
+        Emails fetched this run but not recorded as processed (an error
+        stopped them) are kept for the next run, since the new checkpoint
+        moves past them.
+        """
+        if self._pending_history_id:
+            retry_ids = self.storage.filter_unprocessed(self._seen_ids)
+            with self.storage.transaction():
+                self.storage.set_sync_state(GMAIL_RETRY_KEY, json.dumps(retry_ids))
+                self.storage.set_sync_state(GMAIL_HISTORY_KEY, self._pending_history_id)
+            self._pending_history_id = None
+        self._seen_ids = []
+
+    def queue_mark_as_read(self, email_id: str) -> None:
+        """Queue an email to be marked as read by the next flush."""
+        self._read_queue.append(email_id)
+
+    def flush_read_queue(self) -> dict[str, str]:
+        """Mark all queued emails as read in bulk, returning failures by ID."""
+        if not self._read_queue:
+            return {}
+
+        failures = self.gmail_service.mark_many_as_read(self._read_queue)
+        self._read_queue = []
+        return failures
@@ -0,0 +1,91 @@
+"""Calendar event creation and outcome recording for extracted meetings."""
+
+import logging
+
+from src.mailbox import MailboxReader
+from src.models.config import AppConfig
+from src.models.email import Email
+from src.models.meeting import Meeting
+from src.services.calendar_requests import new_event_id
+from src.services.calendar_service import CalendarService
+from src.utils.storage import EmailStorage, ProcessedRecord
+
+
+class MeetingWriter:
+    """Creates calendar events for meetings, immediately or in end-of-run batches."""
+
+    def __init__(
+        self,
+        config: AppConfig,
+        calendar_service: CalendarService,
+        storage: EmailStorage,
+        mailbox: MailboxReader,
+        logger: logging.Logger,
+    ):
+        """Initialize writer with configuration, services and storage."""
+        self.config = config
+        self.calendar_service = calendar_service
+        self.storage = storage
+        self.mailbox = mailbox
+        self.logger = logger
+        # Queued meetings with the event ID their insert (and any retry) uses
+        self._pending: list[tuple[Email, Meeting, str]] = []
+
+    def write(self, email: Email, meeting: Meeting, stats: dict) -> None:
+        """Create the event now, or queue it when batch inserts are enabled."""
+        calendar_id = self.config.calendar.calendar_id
+
+        if self.config.calendar.skip_duplicates and self.calendar_service.event_exists(
+            meeting, calendar_id
+        ):
+            self.logger.info(f"Matching event already exists for email {email.id}, skipping")
+            self.storage.mark_as_processed(
+                email.id,
+                False,
+                email.subject,
+                email.sender,
+                "Matching calendar event already exists"
+            )
+            return
+
+        if self.config.calendar.batch_inserts:
+            self._pending.append((email, meeting, new_event_id()))
+            if self.config.calendar.skip_duplicates:
+                self.calendar_service.track_meeting(meeting, calendar_id)
+            return
+
+        event_id = self.calendar_service.create_event(meeting, calendar_id)
+        self._record_created(email, meeting, event_id, stats)
+
+    def flush(self, stats: dict) -> None:
+        """Insert all queued meetings with Calendar batch requests."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        results = self.calendar_service.create_events(
+            [meeting for _, meeting, _ in pending],
+            self.config.calendar.calendar_id,
+            [event_id for _, _, event_id in pending],
+        )
+
+        for (email, meeting, _), (event_id, error) in zip(pending, results):
+            if error:
+                self.logger.error(f"Error creating event for email {email.id}: {error}")
+                stats["errors"] += 1
+                continue
+            self._record_created(email, meeting, event_id, stats)
+
+    def _record_created(self, email: Email, meeting: Meeting, event_id: str, stats: dict) -> None:
+        """Record a created event in stats, storage and the read queue."""
+        self.logger.info(f"Created calendar event {event_id} for meeting: {meeting.subject}")
+        stats["meetings_created"] += 1
+
+        # Mark as processed now, even inside deferred_writes: the event already exists
+        self.storage.mark_many(
+            [ProcessedRecord(email.id, True, email.subject, email.sender)], deferrable=False
+        )
+
+        # Queue email to be marked as read at the end of the run
+        if self.config.agent.mark_as_read_after_processing:
+            self.mailbox.queue_mark_as_read(email.id)
@@ -19,6 +19,11 @@ class GmailConfig:
     """Gmail service configuration."""
 
     filters: GmailFilters = field(default_factory=GmailFilters)
+    batch_size: int = 50
+    page_size: int = 100
+    sync_mode: str = "full"
+    server_side_filters: bool = False
+    two_phase_fetch: bool = False
 
 
 @dataclass
@@ -27,6 +32,11 @@ class CalendarConfig:
 
     calendar_id: str = "primary"
     default_duration_minutes: int = 60
+    batch_inserts: bool = False
+    batch_size: int = 50
+    skip_duplicates: bool = False
+    mirror_window_days: int = 7
+    sync_mirror: bool = False
 
 
 @dataclass
@@ -36,6 +46,51 @@ class LLMConfig:
     provider: str = "openai"
     model: str = "gpt-4"
     api_key: str = ""
+    cache_enabled: bool = False
+    cache_ttl_hours: float = 720
+    cache_max_entries: int = 10000
+    cache_memory_entries: int = 256
+    max_concurrency: int = 1
+    prompt_batch_size: int = 1
+    prompt_token_budget: int = 6000
+    rule_fast_path: bool = False
+    compact_bodies: bool = False
+    body_token_budget: int = 1500
+    alternates: list[dict] = field(default_factory=list)
+    hedge_percentile: float = 95.0
+    hedge_min_samples: int = 20
+    failover_errors: int = 3
+    failover_cooldown_seconds: float = 60.0
+
+
+@dataclass
+class ClassifierConfig:
+    """Local meeting pre-classifier configuration."""
+
+    enabled: bool = False
+    threshold: float = 0.5
+    shadow_mode: bool = False
+    weights_path: Optional[str] = None
+
+
+@dataclass
+class NearDuplicateConfig:
+    """Near-duplicate email detection configuration."""
+
+    enabled: bool = False
+    threshold: float = 0.8
+    num_perm: int = 64
+    bands: int = 16
+
+
+@dataclass
+class ReplayConfig:
+    """Record/replay of Google and LLM API calls for offline benchmarks."""
+
+    mode: str = "off"  # off, record or replay
+    fixtures_dir: str = "./fixtures"
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
 
 
 @dataclass
@@ -47,11 +102,28 @@ class AgentConfig:
     mark_as_read_after_processing: bool = True
 
 
+@dataclass
+class RateLimitConfig:
+    """Client-side API quota and retry configuration."""
+
+    gmail_units_per_second: float = 250.0
+    calendar_requests_per_second: float = 10.0
+    llm_requests_per_second: float = 2.0
+    max_retries: int = 5
+    base_delay_seconds: float = 1.0
+    max_delay_seconds: float = 60.0
+
+
 @dataclass
 class StorageConfig:
     """Storage configuration."""
 
     database_path: str = "./data/processed_emails.db"
+    processed_index: bool = False
+    bloom_error_rate: float = 0.01
+    retention_days: int = 0
+    archive_batch_size: int = 1000
+    maintenance_seconds: float = 10.0
 
 
 @dataclass
@@ -69,6 +141,10 @@ class AppConfig:
     gmail: GmailConfig = field(default_factory=GmailConfig)
     calendar: CalendarConfig = field(default_factory=CalendarConfig)
     llm: LLMConfig = field(default_factory=LLMConfig)
+    classifier: ClassifierConfig = field(default_factory=ClassifierConfig)
+    near_duplicates: NearDuplicateConfig = field(default_factory=NearDuplicateConfig)
+    replay: ReplayConfig = field(default_factory=ReplayConfig)
     agent: AgentConfig = field(default_factory=AgentConfig)
+    rate_limits: RateLimitConfig = field(default_factory=RateLimitConfig)
     storage: StorageConfig = field(default_factory=StorageConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
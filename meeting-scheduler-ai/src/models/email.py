@@ -16,6 +16,8 @@ class Email:
     labels: list[str]
     is_read: bool
     thread_id: Optional[str] = None
+    # Raw iCalendar text of an attached meeting invite
+    calendar_data: Optional[str] = None
 
     def get_plain_text_body(self) -> str:
         """Extract plain text from body (HTML or plain text)."""
@@ -1,8 +1,9 @@
 """Meeting data model."""
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
+from zoneinfo import ZoneInfo
 
 
 @dataclass
@@ -15,20 +16,20 @@ class Meeting:
     description: str
     location: Optional[str] = None
     attendees: Optional[list[str]] = None
+    # iCalendar RRULE/EXDATE/RDATE lines for recurring meetings
+    recurrence: Optional[list[str]] = None
+    # IANA zone the meeting is scheduled in; start/end are always naive UTC
+    time_zone: Optional[str] = None
+    # Whole-day event: start/end are midnights and the end day is exclusive
+    all_day: bool = False
 
     def to_calendar_event(self) -> dict:
         """Convert to Google Calendar event format."""
         event = {
             "summary": self.subject,
             "description": self.description,
-            "start": {
-                "dateTime": self.start_datetime.isoformat(),
-                "timeZone": "UTC",
-            },
-            "end": {
-                "dateTime": self.end_datetime.isoformat(),
-                "timeZone": "UTC",
-            },
+            "start": self._event_time(self.start_datetime),
+            "end": self._event_time(self.end_datetime),
         }
 
         if self.location:
@@ -37,8 +38,49 @@ class Meeting:
         if self.attendees:
             event["attendees"] = [{"email": email} for email in self.attendees]
 
+        if self.recurrence:
+            event["recurrence"] = self.recurrence
+
         return event
 
+    def _event_time(self, value: datetime) -> dict:
+        """Calendar start/end, in the meeting's own zone so recurrences follow its DST."""
+        if self.all_day:
+            return {"date": value.date().isoformat()}
+        if not self.time_zone:
+            return {"dateTime": value.isoformat(), "timeZone": "UTC"}
+        local = value.replace(tzinfo=timezone.utc).astimezone(ZoneInfo(self.time_zone))
+        return {"dateTime": local.replace(tzinfo=None).isoformat(), "timeZone": self.time_zone}
+
+    def to_dict(self) -> dict:
+        """Serialize to JSON-compatible fields."""
+        return {
+            "subject": self.subject,
+            "start_datetime": self.start_datetime.isoformat(),
+            "end_datetime": self.end_datetime.isoformat(),
+            "description": self.description,
+            "location": self.location,
+            "attendees": self.attendees,
+            "recurrence": self.recurrence,
+            "time_zone": self.time_zone,
+            "all_day": self.all_day,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Meeting":
+        """Build a meeting from fields produced by to_dict."""
+        return cls(
+            subject=data["subject"],
+            start_datetime=datetime.fromisoformat(data["start_datetime"]),
+            end_datetime=datetime.fromisoformat(data["end_datetime"]),
+            description=data["description"],
+            location=data.get("location"),
+            attendees=data.get("attendees"),
+            recurrence=data.get("recurrence"),
+            time_zone=data.get("time_zone"),
+            all_day=data.get("all_day", False),
+        )
+
     def is_valid(self) -> bool:
         """Validate meeting has required fields."""
         if not self.subject or not self.subject.strip():
@@ -0,0 +1 @@
+"""Record/replay stand-ins for the Google and LLM APIs (offline benchmarks)."""
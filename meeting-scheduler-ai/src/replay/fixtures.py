@@ -0,0 +1,78 @@
+"""Recorded request/response pairs stored as JSON lines."""
+
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+
+class MissingFixtureError(KeyError):
+    """Raised when replaying a request that was never recorded."""
+
+
+class FixtureStore:
+    """Responses keyed by request, replayed in recorded order.
+
+    A request recorded several times (e.g. a list call made on every run)
+    replays its responses in sequence and then keeps returning the last
+    one. Replays sleep latency_ms plus up to jitter_ms to stand in for
+    network time.
+    """
+
+    def __init__(self, path: str, latency_ms: float = 0.0, jitter_ms: float = 0.0):
+        """Initialize store from a fixture file (created on first record)."""
+        self.path = Path(path)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._responses: dict[str, list] = defaultdict(list)
+        self._positions: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        if self.path.exists():
+            with open(self.path, "r") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._responses[entry["key"]].append(entry["response"])
+
+    @staticmethod
+    def make_key(method: str, params: Any) -> str:
+        """Stable key for a method path and its JSON-serializable parameters."""
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return f"{method}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:24]}"
+
+    def record(self, key: str, response: Any) -> None:
+        """Append a response for a key to the fixture file."""
+        with self._lock:
+            self._responses[key].append(response)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(json.dumps({"key": key, "response": response}, default=str) + "\n")
+
+    def replay(self, key: str) -> Any:
+        """Next recorded response for a key, after the injected latency."""
+        time.sleep(self.delay())
+        return self.lookup(key)
+
+    async def replay_async(self, key: str) -> Any:
+        """Async variant of replay that does not block the event loop."""
+        await asyncio.sleep(self.delay())
+        return self.lookup(key)
+
+    def lookup(self, key: str) -> Any:
+        """Next recorded response for a key, without any delay."""
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                raise MissingFixtureError(f"No recorded response for {key} in {self.path}")
+            position = self._positions[key]
+            self._positions[key] = position + 1
+            return responses[min(position, len(responses) - 1)]
+
+    def delay(self) -> float:
+        """Seconds of injected latency for one replayed call."""
+        return (self.latency_ms + random.uniform(0, self.jitter_ms)) / 1000.0
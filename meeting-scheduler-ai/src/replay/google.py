@@ -0,0 +1,68 @@
+"""Recording and replaying stand-ins for googleapiclient discovery resources."""
+
+from pathlib import Path
+from typing import Optional
+
+from googleapiclient.http import HttpRequest
+
+from src.models.config import ReplayConfig
+from src.replay.fixtures import FixtureStore
+from src.replay.google_requests import RecordedBatch, RecordedRequest
+
+
+class RecordedResource:
+    """Stand-in for a discovery Resource (the service or one of its collections).
+
+    With a real resource it records every request made through it; without
+    one it replays. While replaying, a call without arguments (users(),
+    events()) is taken to be a collection and any other call a request.
+    """
+
+    def __init__(self, store: FixtureStore, path: str = "", inner=None):
+        """Initialize resource with its method path prefix and real resource (if recording)."""
+        self.store = store
+        self.path = path
+        self.inner = inner
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = f"{self.path}.{name}".lstrip(".")
+        target = getattr(self.inner, name) if self.inner is not None else None
+
+        def call(*args, **kwargs):
+            if name == "new_batch_http_request":
+                return RecordedBatch(self.store, kwargs.get("callback"), target)
+            if name.endswith("_next"):
+                return self._next_page(target, *args)
+            result = target(**kwargs) if target is not None else None
+            if isinstance(result, HttpRequest) or (target is None and kwargs):
+                return RecordedRequest(self.store, method, kwargs, result)
+            return RecordedResource(self.store, method, result)
+
+        return call
+
+    def _next_page(
+        self, target, request: RecordedRequest, response: dict
+    ) -> Optional[RecordedRequest]:
+        """Request for the page after response (list_next), or None on the last page."""
+        token = response.get("nextPageToken")
+        if not token:
+            return None
+        inner = target(request.inner, response) if target is not None else None
+        params = {**request.params, "pageToken": token}
+        return RecordedRequest(self.store, request.method, params, inner)
+
+
+def attach_google_fixtures(config: ReplayConfig, *services) -> None:
+    """Route each service's API resource through its fixture file.
+
+    Services are GmailService/CalendarService instances; their .service is
+    wrapped when recording, or replaced by a pure replay when it is unset.
+    """
+    for service in services:
+        name = type(service).__name__.replace("Service", "").lower()
+        store = FixtureStore(
+            str(Path(config.fixtures_dir) / f"{name}.jsonl"), config.latency_ms, config.jitter_ms
+        )
+        service.service = RecordedResource(store, inner=service.service)
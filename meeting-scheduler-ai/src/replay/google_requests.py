@@ -0,0 +1,113 @@
+"""Recorded and replayed Google API requests and batch requests."""
+
+import time
+from typing import Callable, Optional
+
+import httplib2
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+
+from src.replay.fixtures import FixtureStore
+
+
+def _error_entry(error: Exception) -> dict:
+    """Fixture entry for a failed request."""
+    if isinstance(error, HttpError):
+        content = error.content.decode("utf-8", "replace")
+        return {"error": {"status": error.resp.status, "content": content}}
+    return {"error": {"status": 500, "content": str(error)}}
+
+
+def _unpack(entry: dict):
+    """Return a recorded response, or raise the recorded HttpError."""
+    if "error" in entry:
+        error = entry["error"]
+        raise HttpError(
+            httplib2.Response({"status": error["status"]}), error["content"].encode("utf-8")
+        )
+    return entry["response"]
+
+
+def _key_params(params: dict) -> dict:
+    """Parameters a request is keyed by: a client-made event ID is random per run."""
+    body = params.get("body")
+    if isinstance(body, dict) and "id" in body:
+        return {**params, "body": {k: v for k, v in body.items() if k != "id"}}
+    return params
+
+
+class RecordedRequest:
+    """Stand-in for an HttpRequest. Records the real response, or replays one."""
+
+    def __init__(
+        self, store: FixtureStore, method: str, params: dict, inner: Optional[HttpRequest]
+    ):
+        """Initialize request with its method path, parameters and real request (if recording)."""
+        self.store = store
+        self.method = method
+        self.params = params
+        self.inner = inner
+        self.key = store.make_key(method, _key_params(params))
+
+    def execute(self, **kwargs):
+        """Execute the real request and record it, or replay the recorded response."""
+        if self.inner is None:
+            return _unpack(self.store.replay(self.key))
+        try:
+            response = self.inner.execute(**kwargs)
+        except HttpError as e:
+            self.store.record(self.key, _error_entry(e))
+            raise
+        self.store.record(self.key, {"response": response})
+        return response
+
+
+class RecordedBatch:
+    """Stand-in for a BatchHttpRequest made of RecordedRequests."""
+
+    def __init__(
+        self, store: FixtureStore, callback: Optional[Callable], inner_factory: Optional[Callable]
+    ):
+        """Initialize batch; inner_factory creates the real batch when recording."""
+        self.store = store
+        self.callback = callback
+        self.inner_factory = inner_factory
+        self._requests: list[tuple[RecordedRequest, Optional[Callable], str]] = []
+
+    def add(
+        self,
+        request: RecordedRequest,
+        callback: Optional[Callable] = None,
+        request_id: Optional[str] = None,
+    ) -> None:
+        """Queue a request, with an optional per-request callback."""
+        request_id = request_id or str(len(self._requests) + 1)
+        self._requests.append((request, callback or self.callback, request_id))
+
+    def execute(self, **kwargs) -> None:
+        """Run the batch, calling each request's callback with its response or error."""
+        if self.inner_factory is None:
+            # One round trip for the whole batch, as on the wire
+            time.sleep(self.store.delay())
+            for request, callback, request_id in self._requests:
+                try:
+                    response, error = _unpack(self.store.lookup(request.key)), None
+                except HttpError as e:
+                    response, error = None, e
+                callback(request_id, response, error)
+            return
+
+        batch = self.inner_factory()
+        for request, callback, request_id in self._requests:
+            batch.add(
+                request.inner, callback=self._recorder(request, callback), request_id=request_id
+            )
+        batch.execute(**kwargs)
+
+    def _recorder(self, request: RecordedRequest, callback: Callable) -> Callable:
+        """Wrap a callback so each batch entry's outcome is recorded first."""
+        def _record(request_id: str, response, error: Optional[Exception]) -> None:
+            entry = {"response": response} if error is None else _error_entry(error)
+            self.store.record(request.key, entry)
+            callback(request_id, response, error)
+        return _record
@@ -0,0 +1,78 @@
+"""Recording and replaying stand-ins for the OpenAI and Anthropic clients."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+
+from src.models.config import LLMConfig, ReplayConfig
+from src.replay.fixtures import FixtureStore
+from src.services.llm_clients import (
+    completion_endpoint,
+    create_async_client,
+    create_client,
+    response_text,
+)
+
+
+def _response(config: LLMConfig, text: str):
+    """A provider-shaped response object holding only the answer text."""
+    if config.provider == "openai":
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+class RecordedLLMClient:
+    """Client exposing chat.completions.create and messages.create.
+
+    With a real client it forwards each request and records the answer
+    text keyed by the request; without one it replays the recorded text.
+    """
+
+    def __init__(self, store: FixtureStore, config: LLMConfig, inner=None, is_async: bool = False):
+        """Initialize client for a provider, wrapping the real client if recording."""
+        self.store = store
+        self.config = config
+        self.inner = inner
+        self.is_async = is_async
+        # Both SDK call shapes lead to create()
+        self.chat = SimpleNamespace(completions=self)
+        self.messages = self
+
+    def create(self, **kwargs):
+        """Complete a request (a coroutine for async clients)."""
+        key = self.store.make_key(f"{self.config.provider}:{self.config.model}", kwargs)
+        if self.is_async:
+            return self._create_async(key, kwargs)
+        if self.inner is None:
+            return _response(self.config, self.store.replay(key))
+        response = completion_endpoint(self.inner, self.config)(**kwargs)
+        self.store.record(key, response_text(self.config, response))
+        return response
+
+    async def _create_async(self, key: str, kwargs: dict):
+        if self.inner is None:
+            return _response(self.config, await self.store.replay_async(key))
+        response = await completion_endpoint(self.inner, self.config)(**kwargs)
+        self.store.record(key, response_text(self.config, response))
+        return response
+
+    async def close(self) -> None:
+        """Close the wrapped async client, if any."""
+        if self.inner is not None:
+            await self.inner.close()
+
+
+def client_factories(config: ReplayConfig) -> tuple[Callable, Callable]:
+    """Sync and async client factories for ProviderPool in record or replay mode."""
+    store = FixtureStore(
+        str(Path(config.fixtures_dir) / "llm.jsonl"), config.latency_ms, config.jitter_ms
+    )
+    if config.mode == "record":
+        return (
+            lambda c: RecordedLLMClient(store, c, create_client(c)),
+            lambda c: RecordedLLMClient(store, c, create_async_client(c), is_async=True),
+        )
+    return (
+        lambda c: RecordedLLMClient(store, c),
+        lambda c: RecordedLLMClient(store, c, is_async=True),
+    )
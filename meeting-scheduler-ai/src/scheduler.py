@@ -6,6 +6,7 @@ from apscheduler.triggers.interval import IntervalTrigger
 
 from src.models.config import AppConfig
 from src.agent import MeetingAgent
+from src.utils.retention import RetentionManager
 
 
 class AgentScheduler:
@@ -16,8 +17,20 @@ class AgentScheduler:
         self.config = config
         self.logger = logger
         self.agent = MeetingAgent(config, logger)
+        self.retention = RetentionManager(
+            config.storage.database_path,
+            config.storage.retention_days,
+            config.storage.archive_batch_size,
+        )
         self.scheduler = BlockingScheduler()
 
+    def run_cycle(self) -> None:
+        """Run the agent, then use the idle time before the next run for storage upkeep."""
+        self.agent.run()
+        result = self.retention.maintain(self.config.storage.maintenance_seconds)
+        if any(result.values()):
+            self.logger.info(f"Storage maintenance: {result}")
+
     def start(self) -> None:
         """Start the scheduler."""
         # Authenticate services once at startup
@@ -26,14 +39,14 @@ class AgentScheduler:
 
         # Run once immediately
         self.logger.info("Running initial agent cycle...")
-        self.agent.run()
+        self.run_cycle()
 
         # Schedule periodic runs
         interval_minutes = self.config.agent.schedule_interval_minutes
         self.logger.info(f"Scheduling agent to run every {interval_minutes} minutes")
 
         self.scheduler.add_job(
-            self.agent.run,
+            self.run_cycle,
             trigger=IntervalTrigger(minutes=interval_minutes),
             id="meeting_agent_job",
             name="Meeting Agent Periodic Run",
@@ -0,0 +1,106 @@
+"""In-memory mirror of calendar events for local duplicate detection."""
+
+import bisect
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from src.models.meeting import Meeting
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def normalize_summary(text: str) -> str:
+    """Lowercase and collapse whitespace for summary comparison."""
+    return " ".join((text or "").lower().split())
+
+
+def parse_event_time(value: dict) -> datetime:
+    """Convert a Calendar start/end object to a naive UTC datetime."""
+    if "dateTime" in value:
+        parsed = datetime.fromisoformat(value["dateTime"].replace("Z", "+00:00"))
+        if parsed.tzinfo:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+    return datetime.combine(date.fromisoformat(value["date"]), datetime.min.time())
+
+
+class CalendarMirror:
+    """Interval index over calendar events, loaded one time window at a time.
+
+    Events are kept sorted by start time. An overlap query bisects the start
+    times between (query start - longest event) and query end, so each lookup
+    only scans events that can overlap the meeting.
+    """
+
+    def __init__(
+        self,
+        list_events: Callable[[datetime, datetime], list[dict]],
+        window_days: int = 7,
+    ):
+        """Initialize mirror with a loader for events in a UTC time range."""
+        self._list_events = list_events
+        self.window = timedelta(days=window_days)
+        self._loaded_windows: set[int] = set()
+        self._event_ids: set[str] = set()
+        self._starts: list[datetime] = []
+        self._entries: list[tuple[datetime, datetime, str]] = []
+        self._max_duration = timedelta(0)
+
+    def event_exists(self, meeting: Meeting) -> bool:
+        """Check for an overlapping event whose summary contains the meeting subject."""
+        start, end = meeting.start_datetime, meeting.end_datetime
+        self._ensure_loaded(start, end)
+
+        subject = normalize_summary(meeting.subject)
+        low = bisect.bisect_left(self._starts, start - self._max_duration)
+        high = bisect.bisect_left(self._starts, end)
+        return any(
+            entry_end > start and subject in summary
+            for _, entry_end, summary in self._entries[low:high]
+        )
+
+    def add_event(self, event: dict) -> None:
+        """Index a Calendar API event resource."""
+        event_id = event.get("id")
+        if event_id in self._event_ids or "start" not in event or "end" not in event:
+            return
+        if event.get("status") == "cancelled":
+            return
+        if event_id:
+            self._event_ids.add(event_id)
+        self._insert(
+            parse_event_time(event["start"]),
+            parse_event_time(event["end"]),
+            normalize_summary(event.get("summary", "")),
+        )
+
+    def add_meeting(self, meeting: Meeting, event_id: Optional[str] = None) -> None:
+        """Index a meeting that was just created or queued for creation."""
+        if event_id:
+            if event_id in self._event_ids:
+                return
+            self._event_ids.add(event_id)
+        self._insert(
+            meeting.start_datetime,
+            meeting.end_datetime,
+            normalize_summary(meeting.subject),
+        )
+
+    def _insert(self, start: datetime, end: datetime, summary: str) -> None:
+        """Insert an entry keeping the index sorted by start time."""
+        index = bisect.bisect_right(self._starts, start)
+        self._starts.insert(index, start)
+        self._entries.insert(index, (start, end, summary))
+        self._max_duration = max(self._max_duration, end - start)
+
+    def _ensure_loaded(self, start: datetime, end: datetime) -> None:
+        """Load every window overlapping [start, end) that is not loaded yet."""
+        first = (start - EPOCH) // self.window
+        last = (end - EPOCH) // self.window
+        for window_index in range(first, last + 1):
+            if window_index in self._loaded_windows:
+                continue
+            window_start = EPOCH + window_index * self.window
+            for event in self._list_events(window_start, window_start + self.window):
+                self.add_event(event)
+            self._loaded_windows.add(window_index)
@@ -0,0 +1,84 @@
+"""Batched and paginated Calendar API requests."""
+
+import uuid
+from datetime import datetime
+
+from googleapiclient.errors import HttpError
+
+from src.utils.rate_limiter import RateLimiter
+
+
+def new_event_id() -> str:
+    """A random client-side event ID, made once per creation attempt.
+
+    Calendar accepts 5-1024 characters from base32hex (a-v, 0-9); hex is
+    a subset.
+    """
+    return uuid.uuid4().hex
+
+
+def insert_event(service, limiter: RateLimiter, calendar_id: str, body: dict) -> dict:
+    """Insert an event whose body carries an ID, returning the created resource.
+
+    A 409 Conflict means an earlier try with this ID already created it (the
+    response was lost), so the existing event is returned instead. If that
+    event has since been cancelled, it is inserted again under a fresh ID.
+    """
+    events = service.events()
+    try:
+        return limiter.execute("calendar", events.insert(calendarId=calendar_id, body=body))
+    except HttpError as e:
+        if e.resp.status != 409:
+            raise
+    event = limiter.execute("calendar", events.get(calendarId=calendar_id, eventId=body["id"]))
+    if event.get("status") == "cancelled":
+        return insert_event(service, limiter, calendar_id, {**body, "id": new_event_id()})
+    return event
+
+
+def list_events(
+    service, limiter: RateLimiter, calendar_id: str, time_min: datetime, time_max: datetime
+) -> list[dict]:
+    """List all single events overlapping a naive UTC time range."""
+    events = service.events()
+    request = events.list(
+        calendarId=calendar_id,
+        timeMin=time_min.isoformat() + "Z",
+        timeMax=time_max.isoformat() + "Z",
+        singleEvents=True,
+        maxResults=2500,
+    )
+
+    items = []
+    while request is not None:
+        response = limiter.execute("calendar", request)
+        items.extend(response.get("items", []))
+        request = events.list_next(request, response)
+    return items
+
+
+def batch_insert_events(
+    service, limiter: RateLimiter, calendar_id: str, bodies: dict[int, dict], batch_size: int
+) -> dict[int, dict]:
+    """Insert event bodies in Calendar batch requests.
+
+    Takes event bodies (with client IDs) keyed by caller index and returns the
+    created event resources under the same keys. Failed inserts are left out.
+    """
+    created: dict[int, dict] = {}
+
+    def _collect(request_id: str, response: dict, exception: Exception) -> None:
+        if exception is None:
+            created[int(request_id)] = response
+
+    indexes = list(bodies)
+    step = max(batch_size, 1)
+    for start in range(0, len(indexes), step):
+        chunk = indexes[start:start + step]
+        batch = service.new_batch_http_request(callback=_collect)
+        for index in chunk:
+            request = service.events().insert(calendarId=calendar_id, body=bodies[index])
+            batch.add(request, request_id=str(index))
+        limiter.execute("calendar", batch, len(chunk))
+
+    return created
@@ -1,13 +1,21 @@
 """Google Calendar API service."""
 
-import os.path
-import pickle
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
+from functools import partial
+from typing import Optional
 from googleapiclient.discovery import build
 
 from src.models.meeting import Meeting
+from src.services.calendar_mirror import CalendarMirror
+from src.services.calendar_requests import (
+    batch_insert_events,
+    insert_event,
+    list_events,
+    new_event_id,
+)
+from src.services.calendar_sync import sync_calendar
+from src.services.google_auth import load_credentials
+from src.utils.calendar_store import CalendarStore
+from src.utils.rate_limiter import RateLimiter
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
@@ -15,66 +23,127 @@ SCOPES = ["https://www.googleapis.com/auth/calendar"]
 class CalendarService:
     """Service for interacting with Google Calendar API."""
 
-    def __init__(self, credentials_file: str = "credentials.json"):
+    def __init__(
+        self,
+        credentials_file: str = "credentials.json",
+        rate_limiter: Optional[RateLimiter] = None,
+        batch_size: int = 50,
+        mirror_window_days: int = 7,
+        event_store: Optional[CalendarStore] = None,
+    ):
         """Initialize Calendar service with OAuth credentials."""
         self.credentials_file = credentials_file
+        self.batch_size = batch_size
+        self.mirror_window_days = mirror_window_days
+        self._mirrors: dict[str, CalendarMirror] = {}
+        self.event_store = event_store
+        self.rate_limiter = rate_limiter or RateLimiter()
         self.token_file = "calendar_token.pickle"
         self.service = None
 
     def authenticate(self) -> None:
         """Authenticate with Google Calendar API using OAuth2."""
-        creds = None
-
-        if os.path.exists(self.token_file):
-            with open(self.token_file, "rb") as token:
-                creds = pickle.load(token)
-
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.credentials_file, SCOPES
-                )
-                creds = flow.run_local_server(port=0)
-
-            with open(self.token_file, "wb") as token:
-                pickle.dump(creds, token)
-
+        creds = load_credentials(self.credentials_file, self.token_file, SCOPES)
         self.service = build("calendar", "v3", credentials=creds)
 
-    def create_event(self, meeting: Meeting, calendar_id: str = "primary") -> str:
-        """Create a calendar event from a Meeting object."""
+    def create_event(
+        self, meeting: Meeting, calendar_id: str = "primary", event_id: Optional[str] = None
+    ) -> str:
+        """Create a calendar event from a Meeting object, under event_id if given."""
         if not self.service:
             raise RuntimeError("Service not authenticated. Call authenticate() first.")
 
         if not meeting.is_valid():
             raise ValueError("Invalid meeting data")
 
-        event_body = meeting.to_calendar_event()
+        event_body = {**meeting.to_calendar_event(), "id": event_id or new_event_id()}
+        event = insert_event(self.service, self.rate_limiter, calendar_id, event_body)
 
-        event = self.service.events().insert(
-            calendarId=calendar_id,
-            body=event_body
-        ).execute()
+        self._mirror_event(calendar_id, event)
 
         return event.get("id", "")
 
+    def create_events(
+        self, meetings: list[Meeting], calendar_id: str = "primary",
+        event_ids: Optional[list[str]] = None,
+    ) -> list[tuple[Optional[str], Optional[str]]]:
+        """Create many calendar events using Calendar batch requests.
+
+        Returns an (event_id, error) pair per meeting, in input order. Inserts
+        that fail in a batch are retried one by one under the same event_ids
+        (fresh ones when omitted), so a retry never creates a second event.
+        """
+        if not self.service:
+            raise RuntimeError("Service not authenticated. Call authenticate() first.")
+
+        event_ids = event_ids or [new_event_id() for _ in meetings]
+        bodies = {
+            index: {**meeting.to_calendar_event(), "id": event_ids[index]}
+            for index, meeting in enumerate(meetings)
+            if meeting.is_valid()
+        }
+        created = batch_insert_events(
+            self.service, self.rate_limiter, calendar_id, bodies, self.batch_size
+        )
+
+        results = []
+        for index, meeting in enumerate(meetings):
+            if index in created:
+                self._mirror_event(calendar_id, created[index])
+                results.append((created[index].get("id", ""), None))
+            else:
+                results.append(self._create_event_result(meeting, calendar_id, event_ids[index]))
+        return results
+
     def event_exists(self, meeting: Meeting, calendar_id: str = "primary") -> bool:
-        """Check if a similar event already exists."""
+        """Check if a similar event already exists, using the local mirror."""
         if not self.service:
             raise RuntimeError("Service not authenticated.")
 
-        # Search for events with same summary and start time
-        time_min = meeting.start_datetime.isoformat()
-        time_max = meeting.end_datetime.isoformat()
+        return self._get_mirror(calendar_id).event_exists(meeting)
 
-        events = self.service.events().list(
-            calendarId=calendar_id,
-            timeMin=time_min,
-            timeMax=time_max,
-            q=meeting.subject,
-            singleEvents=True,
-        ).execute()
+    def track_meeting(self, meeting: Meeting, calendar_id: str = "primary") -> None:
+        """Record a meeting queued for creation so duplicates of it are caught."""
+        self._get_mirror(calendar_id).add_meeting(meeting)
 
-        return len(events.get("items", [])) > 0
+    def sync_event_store(self, calendar_id: str = "primary") -> int:
+        """Incrementally sync the persistent event store, returning changes applied."""
+        if not self.service:
+            raise RuntimeError("Service not authenticated.")
+        if not self.event_store:
+            raise RuntimeError("No event store configured.")
+
+        return sync_calendar(self.service, self.rate_limiter, self.event_store, calendar_id)
+
+    def clear_mirrors(self) -> None:
+        """Drop mirrored events so the next check reloads them from the API."""
+        self._mirrors = {}
+
+    def _create_event_result(
+        self, meeting: Meeting, calendar_id: str, event_id: str
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Create one event, returning (event_id, error) instead of raising."""
+        try:
+            return self.create_event(meeting, calendar_id, event_id), None
+        except Exception as e:
+            return None, str(e)
+
+    def _mirror_event(self, calendar_id: str, event: dict) -> None:
+        """Add a created event to the event store and any loaded mirror."""
+        if self.event_store:
+            self.event_store.apply_events(calendar_id, [event])
+        if calendar_id in self._mirrors:
+            self._mirrors[calendar_id].add_event(event)
+
+    def _get_mirror(self, calendar_id: str) -> CalendarMirror:
+        """Return a calendar's mirror, on the event store (synced each run) if configured."""
+        if calendar_id in self._mirrors:
+            return self._mirrors[calendar_id]
+
+        if self.event_store:
+            loader = partial(self.event_store.list_events, calendar_id)
+        else:
+            loader = partial(list_events, self.service, self.rate_limiter, calendar_id)
+
+        self._mirrors[calendar_id] = CalendarMirror(loader, self.mirror_window_days)
+        return self._mirrors[calendar_id]
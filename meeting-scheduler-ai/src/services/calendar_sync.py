@@ -0,0 +1,57 @@
+"""Incremental Calendar sync into the local event store."""
+
+from typing import Optional
+from googleapiclient.errors import HttpError
+
+from src.utils.calendar_store import CalendarStore
+from src.utils.rate_limiter import RateLimiter
+
+
+def sync_calendar(
+    service, limiter: RateLimiter, store: CalendarStore, calendar_id: str
+) -> int:
+    """Bring the local copy of a calendar up to date, returning changes applied.
+
+    Uses the stored syncToken for an incremental sync. A 410 Gone response
+    means the token is no longer valid, so the local copy is dropped and
+    rebuilt with a full sync.
+    """
+    sync_token = store.get_sync_token(calendar_id)
+    try:
+        return _sync(service, limiter, store, calendar_id, sync_token)
+    except HttpError as e:
+        if e.resp.status != 410 or sync_token is None:
+            raise
+
+    store.reset(calendar_id)
+    return _sync(service, limiter, store, calendar_id, None)
+
+
+def _sync(
+    service,
+    limiter: RateLimiter,
+    store: CalendarStore,
+    calendar_id: str,
+    sync_token: Optional[str],
+) -> int:
+    """Page through events().list and apply every page to the store."""
+    events = service.events()
+    params = {"calendarId": calendar_id, "singleEvents": True, "maxResults": 2500}
+    if sync_token:
+        params["syncToken"] = sync_token
+
+    request = events.list(**params)
+    changed = 0
+    next_sync_token = None
+
+    while request is not None:
+        response = limiter.execute("calendar", request)
+        items = response.get("items", [])
+        store.apply_events(calendar_id, items)
+        changed += len(items)
+        next_sync_token = response.get("nextSyncToken", next_sync_token)
+        request = events.list_next(request, response)
+
+    if next_sync_token:
+        store.set_sync_token(calendar_id, next_sync_token)
+    return changed
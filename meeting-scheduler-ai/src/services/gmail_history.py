@@ -0,0 +1,57 @@
+"""Gmail History API helpers for incremental mailbox sync."""
+
+from googleapiclient.errors import HttpError
+
+from src.utils.rate_limiter import RateLimiter
+
+# Gmail API quota units per history().list call
+HISTORY_LIST_UNITS = 2
+
+# messages().list leaves these out by default; history does not
+EXCLUDED_LABELS = {"SPAM", "TRASH"}
+
+
+class HistoryExpiredError(Exception):
+    """Raised when a stored historyId is too old for the History API."""
+
+
+def list_added_message_ids(
+    service, limiter: RateLimiter, start_history_id: str
+) -> tuple[list[str], str]:
+    """List IDs of messages added since a historyId, newest first.
+
+    Messages added to spam or trash are skipped, as messages().list does.
+    Returns the message IDs together with the mailbox's current historyId,
+    which becomes the checkpoint for the next sync.
+    """
+    message_ids = []
+    seen = set()
+    history_id = start_history_id
+
+    request = service.users().history().list(
+        userId="me",
+        startHistoryId=start_history_id,
+        historyTypes=["messageAdded"],
+    )
+
+    try:
+        while request is not None:
+            response = limiter.execute("gmail", request, HISTORY_LIST_UNITS)
+            for record in response.get("history", []):
+                for added in record.get("messagesAdded", []):
+                    message = added["message"]
+                    msg_id = message["id"]
+                    if EXCLUDED_LABELS.intersection(message.get("labelIds", [])):
+                        continue
+                    if msg_id not in seen:
+                        seen.add(msg_id)
+                        message_ids.append(msg_id)
+            history_id = response.get("historyId", history_id)
+            request = service.users().history().list_next(request, response)
+    except HttpError as e:
+        if e.resp.status == 404:
+            raise HistoryExpiredError(f"historyId {start_history_id} has expired") from e
+        raise
+
+    message_ids.reverse()
+    return message_ids, history_id
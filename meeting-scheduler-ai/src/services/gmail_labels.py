@@ -0,0 +1,50 @@
+"""Gmail label modification helpers."""
+
+from googleapiclient.errors import HttpError
+
+from src.utils.rate_limiter import RateLimiter
+
+# Maximum number of message IDs accepted by one batchModify call
+BATCH_MODIFY_LIMIT = 1000
+
+# Gmail API quota units per call
+MODIFY_UNITS = 5
+BATCH_MODIFY_UNITS = 50
+
+
+def remove_label(service, limiter: RateLimiter, email_id: str, label: str) -> None:
+    """Remove a label from a single message."""
+    request = service.users().messages().modify(
+        userId="me",
+        id=email_id,
+        body={"removeLabelIds": [label]}
+    )
+    limiter.execute("gmail", request, MODIFY_UNITS)
+
+
+def batch_remove_label(
+    service, limiter: RateLimiter, email_ids: list[str], label: str
+) -> dict[str, str]:
+    """Remove a label from many messages with batchModify.
+
+    Returns a mapping of email ID to error message for the IDs that could not
+    be updated. A failed chunk is retried one ID at a time so that failures
+    are reported per ID.
+    """
+    failures = {}
+    for start in range(0, len(email_ids), BATCH_MODIFY_LIMIT):
+        chunk = email_ids[start:start + BATCH_MODIFY_LIMIT]
+        request = service.users().messages().batchModify(
+            userId="me",
+            body={"ids": chunk, "removeLabelIds": [label]}
+        )
+        try:
+            limiter.execute("gmail", request, BATCH_MODIFY_UNITS)
+        except HttpError:
+            for email_id in chunk:
+                try:
+                    remove_label(service, limiter, email_id, label)
+                except HttpError as e:
+                    failures[email_id] = str(e)
+
+    return failures
@@ -0,0 +1,57 @@
+"""Conversion of raw Gmail API messages into Email objects."""
+
+import base64
+from typing import Iterator, Optional
+
+from src.models.email import Email
+
+CALENDAR_MIME_TYPES = ("text/calendar", "application/ics")
+
+
+def parse_message(msg: dict) -> Email:
+    """Build an Email from a Gmail API message resource."""
+    headers = {h["name"]: h["value"] for h in msg["payload"]["headers"]}
+
+    labels = msg.get("labelIds", [])
+
+    return Email(
+        id=msg["id"],
+        sender=headers.get("From", ""),
+        subject=headers.get("Subject", ""),
+        body=extract_body(msg["payload"]),
+        received_date=headers.get("Date", ""),
+        labels=labels,
+        is_read="UNREAD" not in labels,
+        thread_id=msg.get("threadId"),
+        calendar_data=extract_calendar(msg["payload"]),
+    )
+
+
+def iter_parts(payload: dict) -> Iterator[dict]:
+    """Yield every MIME part of a payload, depth first, including nested multiparts."""
+    for part in payload.get("parts", []):
+        yield part
+        yield from iter_parts(part)
+
+
+def extract_body(payload: dict) -> str:
+    """Extract email body from payload."""
+    for part in iter_parts(payload):
+        if part["mimeType"] == "text/plain" and "data" in part.get("body", {}):
+            data = part["body"]["data"]
+            return base64.urlsafe_b64decode(data).decode("utf-8")
+
+    if "body" in payload and "data" in payload["body"]:
+        data = payload["body"]["data"]
+        return base64.urlsafe_b64decode(data).decode("utf-8")
+
+    return ""
+
+
+def extract_calendar(payload: dict) -> Optional[str]:
+    """Return the first inline text/calendar part (an invite), if any."""
+    for part in [payload, *iter_parts(payload)]:
+        if part.get("mimeType") in CALENDAR_MIME_TYPES and "data" in part.get("body", {}):
+            data = part["body"]["data"]
+            return base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
+    return None
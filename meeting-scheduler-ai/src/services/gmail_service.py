@@ -1,15 +1,16 @@
 """Gmail API service."""
 
-import base64
-from typing import Optional
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
+from itertools import chain
+from typing import Iterator, Optional
 from googleapiclient.discovery import build
-import os.path
-import pickle
 
 from src.models.email import Email
+from src.services.gmail_fetch import MESSAGE_LIST_UNITS, batch_get_messages
+from src.services.gmail_labels import batch_remove_label, remove_label
+from src.services.gmail_history import HistoryExpiredError, list_added_message_ids
+from src.services.gmail_parser import parse_message
+from src.services.google_auth import load_credentials
+from src.utils.rate_limiter import RateLimiter
 
 SCOPES = ["https://www.googleapis.com/auth/gmail.readonly",
           "https://www.googleapis.com/auth/gmail.modify"]
@@ -18,101 +19,129 @@ SCOPES = ["https://www.googleapis.com/auth/gmail.readonly",
 class GmailService:
     """Service for interacting with Gmail API."""
 
-    def __init__(self, credentials_file: str = "credentials.json"):
+    def __init__(
+        self,
+        credentials_file: str = "credentials.json",
+        batch_size: int = 50,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         """Initialize Gmail service with OAuth credentials."""
         self.credentials_file = credentials_file
+        self.batch_size = batch_size
+        self.rate_limiter = rate_limiter or RateLimiter()
         self.token_file = "gmail_token.pickle"
         self.service = None
 
     def authenticate(self) -> None:
         """Authenticate with Gmail API using OAuth2."""
-        creds = None
-
-        if os.path.exists(self.token_file):
-            with open(self.token_file, "rb") as token:
-                creds = pickle.load(token)
-
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.credentials_file, SCOPES
-                )
-                creds = flow.run_local_server(port=0)
-
-            with open(self.token_file, "wb") as token:
-                pickle.dump(creds, token)
-
+        creds = load_credentials(self.credentials_file, self.token_file, SCOPES)
         self.service = build("gmail", "v1", credentials=creds)
 
-    def get_emails(self, max_results: int = 50) -> list[Email]:
-        """Fetch emails from Gmail."""
+    def iter_emails(
+        self,
+        query: Optional[dict] = None,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+        metadata_only: bool = False,
+    ) -> Iterator[Email]:
+        """Yield emails lazily, following list page tokens.
+
+        Only one page of IDs and one batch of messages are held in memory at
+        a time. Stops after limit emails when a limit is given.
+        """
         if not self.service:
             raise RuntimeError("Service not authenticated. Call authenticate() first.")
 
-        results = self.service.users().messages().list(
-            userId="me", maxResults=max_results
-        ).execute()
-
-        messages = results.get("messages", [])
-        emails = []
-
-        for msg in messages:
-            email = self._fetch_email_details(msg["id"])
-            if email:
-                emails.append(email)
-
-        return emails
-
-    def _fetch_email_details(self, msg_id: str) -> Optional[Email]:
-        """Fetch full details for a specific email."""
-        msg = self.service.users().messages().get(
-            userId="me", id=msg_id, format="full"
-        ).execute()
-
-        headers = {h["name"]: h["value"] for h in msg["payload"]["headers"]}
-
-        sender = headers.get("From", "")
-        subject = headers.get("Subject", "")
-        date = headers.get("Date", "")
-
-        body = self._extract_body(msg["payload"])
-        labels = msg.get("labelIds", [])
-        is_read = "UNREAD" not in labels
-
-        return Email(
-            id=msg_id,
-            sender=sender,
-            subject=subject,
-            body=body,
-            received_date=date,
-            labels=labels,
-            is_read=is_read,
-            thread_id=msg.get("threadId"),
-        )
-
-    def _extract_body(self, payload: dict) -> str:
-        """Extract email body from payload."""
-        if "parts" in payload:
-            for part in payload["parts"]:
-                if part["mimeType"] == "text/plain":
-                    data = part["body"].get("data", "")
-                    return base64.urlsafe_b64decode(data).decode("utf-8")
-
-        if "body" in payload and "data" in payload["body"]:
-            data = payload["body"]["data"]
-            return base64.urlsafe_b64decode(data).decode("utf-8")
+        return self._iter_pages(query or {}, page_size, limit, metadata_only)
+
+    def get_emails(
+        self,
+        max_results: int = 50,
+        query: Optional[dict] = None,
+        metadata_only: bool = False,
+    ) -> list[Email]:
+        """Fetch emails from Gmail, optionally narrowed by q/labelIds parameters."""
+        return list(self.iter_emails(query, max_results, max_results, metadata_only))
+
+    def sync_emails(
+        self,
+        start_history_id: Optional[str],
+        max_results: int = 50,
+        query: Optional[dict] = None,
+        metadata_only: bool = False,
+        page_size: int = 100,
+        retry_ids: Optional[list[str]] = None,
+    ) -> tuple[Iterator[Email], str]:
+        """Stream emails added since a historyId checkpoint.
+
+        Falls back to the newest max_results messages when there is no
+        checkpoint yet or it has expired. retry_ids (emails a previous run
+        failed on) are fetched first. Returns the email stream and the new
+        checkpoint to store once the stream has been consumed.
+        """
+        if not self.service:
+            raise RuntimeError("Service not authenticated. Call authenticate() first.")
+        retry_ids = list(retry_ids or [])
 
-        return ""
+        if start_history_id:
+            try:
+                msg_ids, history_id = list_added_message_ids(
+                    self.service, self.rate_limiter, start_history_id
+                )
+                retry = set(retry_ids)
+                msg_ids = retry_ids + [msg_id for msg_id in msg_ids if msg_id not in retry]
+                return self._iter_fetch(msg_ids, metadata_only), history_id
+            except HistoryExpiredError:
+                pass
+
+        profile = self.rate_limiter.execute(
+            "gmail", self.service.users().getProfile(userId="me")
+        )
+        emails = self.iter_emails(query, page_size, max_results, metadata_only)
+        return chain(self._iter_fetch(retry_ids, metadata_only), emails), profile["historyId"]
+
+    def fetch_bodies(self, emails: list[Email]) -> list[Email]:
+        """Re-fetch metadata-only emails with their full bodies."""
+        return list(self._iter_fetch([email.id for email in emails]))
+
+    def _iter_pages(
+        self, query: dict, page_size: int, limit: Optional[int], metadata_only: bool
+    ) -> Iterator[Email]:
+        """Walk messages().list pages and yield the emails on each."""
+        messages = self.service.users().messages()
+        request = messages.list(userId="me", maxResults=page_size, **query)
+        remaining = limit
+
+        while request is not None and remaining != 0:
+            response = self.rate_limiter.execute("gmail", request, MESSAGE_LIST_UNITS)
+            msg_ids = [msg["id"] for msg in response.get("messages", [])]
+            if remaining is not None:
+                msg_ids = msg_ids[:remaining]
+                remaining -= len(msg_ids)
+
+            yield from self._iter_fetch(msg_ids, metadata_only)
+            request = messages.list_next(request, response)
+
+    def _iter_fetch(self, msg_ids: list[str], metadata_only: bool = False) -> Iterator[Email]:
+        """Yield emails for the given IDs one Gmail batch at a time."""
+        step = max(self.batch_size, 1)
+        for start in range(0, len(msg_ids), step):
+            chunk = msg_ids[start:start + step]
+            messages = batch_get_messages(
+                self.service, self.rate_limiter, chunk, self.batch_size, metadata_only
+            )
+            yield from (parse_message(msg) for msg in messages)
 
     def mark_as_read(self, email_id: str) -> None:
         """Mark an email as read."""
         if not self.service:
             raise RuntimeError("Service not authenticated.")
 
-        self.service.users().messages().modify(
-            userId="me",
-            id=email_id,
-            body={"removeLabelIds": ["UNREAD"]}
-        ).execute()
+        remove_label(self.service, self.rate_limiter, email_id, "UNREAD")
+
+    def mark_many_as_read(self, email_ids: list[str]) -> dict[str, str]:
+        """Mark emails as read in bulk, returning error messages by ID."""
+        if not self.service:
+            raise RuntimeError("Service not authenticated.")
+
+        return batch_remove_label(self.service, self.rate_limiter, email_ids, "UNREAD")
@@ -0,0 +1,27 @@
+"""Shared OAuth2 credential handling for Google APIs."""
+
+import os.path
+import pickle
+from google_auth_oauthlib.flow import InstalledAppFlow
+from google.auth.transport.requests import Request
+
+
+def load_credentials(credentials_file: str, token_file: str, scopes: list[str]):
+    """Load cached OAuth2 credentials, refreshing or re-authorizing as needed."""
+    creds = None
+
+    if os.path.exists(token_file):
+        with open(token_file, "rb") as token:
+            creds = pickle.load(token)
+
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        else:
+            flow = InstalledAppFlow.from_client_secrets_file(credentials_file, scopes)
+            creds = flow.run_local_server(port=0)
+
+        with open(token_file, "wb") as token:
+            pickle.dump(creds, token)
+
+    return creds
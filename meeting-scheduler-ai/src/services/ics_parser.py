@@ -0,0 +1,136 @@
+"""Streaming parser for text/calendar (iCalendar) meeting invites."""
+
+import re
+from datetime import timedelta, timezone
+from typing import Iterable, Iterator, Optional
+
+from src.models.email import Email
+from src.models.meeting import Meeting
+from src.services.ics_values import (
+    is_date_value,
+    parse_duration,
+    parse_utc_offset,
+    to_utc,
+    unescape_text,
+    zone_name,
+)
+
+TEXT_PROPERTIES = ("SUMMARY", "DESCRIPTION", "LOCATION")
+# Properties passed through to Calendar as the event's recurrence
+RECURRENCE_PROPERTIES = ("RRULE", "EXRULE", "RDATE", "EXDATE")
+
+
+def is_cancellation(method: Optional[str], event: Optional[dict]) -> bool:
+    """Whether an invite cancels a meeting: METHOD:CANCEL or a cancelled master event."""
+    status = (event or {}).get("STATUS", ("",))[0].upper()
+    return method == "CANCEL" or status == "CANCELLED"
+
+
+def unfold_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Join folded content lines (continuations start with a space or tab)."""
+    current = None
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def parse_property(line: str) -> tuple[str, dict[str, str], str]:
+    """Split a content line into (NAME, params, value)."""
+    in_quotes, split = False, len(line)
+    for i, char in enumerate(line):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ":" and not in_quotes:
+            split = i
+            break
+    name, *raw_params = line[:split].split(";")
+    params = {k.upper(): v.strip('"') for k, _, v in (p.partition("=") for p in raw_params)}
+    return name.upper(), params, line[split + 1:]
+
+
+def scan_invite(lines: Iterable[str]) -> tuple[Optional[str], Optional[dict], dict]:
+    """Read an invite's METHOD, master VEVENT properties and VTIMEZONE offsets."""
+    offsets: dict[str, timezone] = {}
+    tzid, stack, event, method = None, [], None, None
+    for line in unfold_lines(lines):
+        name, params, value = parse_property(line)
+        if name == "BEGIN":
+            stack.append(value.upper())
+            if value.upper() == "VEVENT" and event is None:
+                event = {"attendees": [], "recurrence": []}
+        elif name == "END":
+            if (stack.pop() if stack else None) == "VEVENT" and event is not None:
+                # Overrides of single occurrences are skipped in favour of the master
+                if "DTSTART" in event and "RECURRENCE-ID" not in event:
+                    break
+                event = None
+        elif name == "METHOD" and not stack[1:]:
+            method = value.strip().upper()
+        elif stack[-1:] == ["VTIMEZONE"] and name == "TZID":
+            tzid = value
+        elif stack[-1:] in (["STANDARD"], ["DAYLIGHT"]) and name == "TZOFFSETTO" and tzid:
+            offset = parse_utc_offset(value)
+            if offset and (stack[-1] == "STANDARD" or tzid not in offsets):
+                offsets[tzid] = offset
+        elif stack[-1:] == ["VEVENT"] and event is not None:
+            if name == "ATTENDEE":
+                event["attendees"].append(re.sub(r"(?i)^mailto:", "", value))
+            elif name in RECURRENCE_PROPERTIES:
+                event["recurrence"].append(line)
+            else:
+                event[name] = (value, params)
+    return method, event, offsets
+
+
+def _build_meeting(event: dict, offsets: dict, default_duration: int) -> Optional[Meeting]:
+    """Create the Meeting for a parsed VEVENT, or None when it is unusable."""
+    if "DTSTART" not in event:
+        return None
+    all_day = is_date_value(*event["DTSTART"])
+    try:
+        start = to_utc(*event["DTSTART"], offsets)
+        if "DTEND" in event:
+            end = to_utc(*event["DTEND"], offsets)
+        else:
+            duration = parse_duration(event.get("DURATION", ("",))[0])
+            default = timedelta(days=1) if all_day else timedelta(minutes=default_duration)
+            end = start + (duration or default)
+    except (ValueError, OverflowError):
+        return None
+
+    text = {k: unescape_text(v[0]) for k, v in event.items() if k in TEXT_PROPERTIES}
+    return Meeting(
+        subject=text.get("SUMMARY") or "Meeting",
+        start_datetime=start,
+        end_datetime=end,
+        description=text.get("DESCRIPTION", ""),
+        location=text.get("LOCATION"),
+        attendees=event["attendees"] or None,
+        recurrence=event["recurrence"] or None,
+        time_zone=None if all_day else zone_name(event["DTSTART"][1].get("TZID")),
+        all_day=all_day,
+    )
+
+
+def read_invites(emails: list[Email], default_duration: int) -> dict[str, Optional[Meeting]]:
+    """Meetings from attached invites, keyed by email ID (None marks a cancellation).
+
+    Emails whose invite cannot be parsed are left out so they go to the LLM.
+    """
+    invites: dict[str, Optional[Meeting]] = {}
+    for email in (email for email in emails if email.calendar_data):
+        method, event, offsets = scan_invite(email.calendar_data.splitlines())
+        if is_cancellation(method, event):
+            invites[email.id] = None
+            continue
+        meeting = _build_meeting(event, offsets, default_duration) if event else None
+        if meeting:
+            invites[email.id] = meeting
+    return invites
@@ -0,0 +1,76 @@
+"""Value types of iCalendar properties: text, dates, durations and zones."""
+
+import re
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from src.services.windows_zones import WINDOWS_ZONES
+
+DURATION_PATTERN = re.compile(
+    r"^(-)?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$"
+)
+OFFSET_PATTERN = re.compile(r"^([+-])(\d{2})(\d{2})$")
+
+
+def unescape_text(value: str) -> str:
+    """Undo iCalendar TEXT escaping."""
+    return re.sub(r"\\([nN,;\\])", lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+
+def zone_name(tzid: Optional[str]) -> Optional[str]:
+    """IANA name for a TZID, translating Windows zone names; None if unknown."""
+    if not tzid:
+        return None
+    name = WINDOWS_ZONES.get(tzid.strip(), tzid)
+    try:
+        ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+    return name
+
+
+def resolve_zone(tzid: Optional[str], offsets: dict[str, timezone]) -> Optional[tzinfo]:
+    """Resolve a TZID to an IANA zone or, failing that, its VTIMEZONE offset."""
+    name = zone_name(tzid)
+    if name:
+        return ZoneInfo(name)
+    return offsets.get(tzid) if tzid else None
+
+
+def is_date_value(value: str, params: dict[str, str]) -> bool:
+    """Whether a DTSTART/DTEND holds a DATE (whole day) rather than a DATE-TIME."""
+    return params.get("VALUE") == "DATE" or len(value) == 8
+
+
+def to_utc(value: str, params: dict[str, str], offsets: dict[str, timezone]) -> datetime:
+    """Convert a DATE or DATE-TIME value to naive UTC (floating times are taken as UTC)."""
+    if is_date_value(value, params):
+        return datetime.strptime(value[:8], "%Y%m%d")
+    parsed = datetime.strptime(value.rstrip("Z"), "%Y%m%dT%H%M%S")
+    zone = timezone.utc if value.endswith("Z") else resolve_zone(params.get("TZID"), offsets)
+    if zone is None:
+        return parsed
+    return parsed.replace(tzinfo=zone).astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def parse_duration(value: str) -> Optional[timedelta]:
+    """Parse an iCalendar DURATION such as PT1H30M or P1D."""
+    match = DURATION_PATTERN.match(value.strip())
+    if not match:
+        return None
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    delta = timedelta(
+        weeks=int(weeks or 0), days=int(days or 0), hours=int(hours or 0),
+        minutes=int(minutes or 0), seconds=int(seconds or 0),
+    )
+    return -delta if sign else delta
+
+
+def parse_utc_offset(value: str) -> Optional[timezone]:
+    """Parse a UTC offset such as -0500 into a fixed timezone."""
+    match = OFFSET_PATTERN.match(value.strip()[:5])
+    if not match:
+        return None
+    offset = timedelta(hours=int(match.group(2)), minutes=int(match.group(3)))
+    return timezone(-offset if match.group(1) == "-" else offset)
@@ -0,0 +1,109 @@
+"""Concurrent meeting extraction using the async provider clients."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Optional, Union
+
+from src.models.meeting import Meeting
+from src.services.llm_clients import MAX_OUTPUT_TOKENS, call_provider_async
+from src.services.llm_health import ProviderHealth
+from src.services.llm_prompt import build_extraction_prompt, parse_llm_response
+from src.services.llm_providers import ProviderPool
+
+# A meeting (or None when the email holds none), or the error that occurred
+ExtractionResult = Union[Optional[Meeting], Exception]
+
+AsyncComplete = Callable[..., Awaitable[str]]
+
+
+@asynccontextmanager
+async def provider_session(
+    pool: ProviderPool, slots: asyncio.Semaphore
+) -> AsyncIterator[AsyncComplete]:
+    """Open async clients for the pool and yield a hedged completion function.
+
+    Hedging and failover follow ProviderPool.complete; a losing request is
+    cancelled as soon as another provider answers. Each provider request,
+    hedges included, holds one of the slots from before its hedge timer is
+    armed until it finishes or is cancelled. A hedge is only sent while a
+    slot is free.
+    """
+    clients = {p.key: pool.async_client_factory(p.config) for p in pool.providers}
+
+    async def call(provider: ProviderHealth, prompt: str, max_tokens: int) -> str:
+        async def request() -> str:
+            # Timed after the rate limiter grants the request
+            started = time.monotonic()
+            text = await call_provider_async(
+                clients[provider.key], provider.config, prompt, max_tokens
+            )
+            provider.record_success(time.monotonic() - started)
+            return text
+
+        try:
+            return await pool.rate_limiter.call_async("llm", request, retries=pool.retries)
+        except Exception:
+            provider.record_failure()
+            raise
+
+    async def complete(prompt: str, max_tokens: int = MAX_OUTPUT_TOKENS) -> str:
+        queue = pool.ordered()
+        pending: dict = {}
+        last_error: Optional[Exception] = None
+        delay = None
+        try:
+            while queue or pending:
+                hedge = delay is not None and not slots.locked()
+                if queue and (not pending or hedge):
+                    await slots.acquire()
+                    provider = pool.launch(queue, pending, last_error)
+                    task = asyncio.ensure_future(call(provider, prompt, max_tokens))
+                    task.add_done_callback(lambda _: slots.release())
+                    pending[task] = provider
+                    delay = pool.hedge_delay(provider, queue)
+                done, _ = await asyncio.wait(
+                    pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    provider = pending.pop(task)
+                    if task.exception() is None:
+                        provider.record_win()
+                        return task.result()
+                    last_error = task.exception()
+                # Keep hedging only when the wait timed out (nothing finished)
+                delay = delay if not done else None
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    try:
+        yield complete
+    finally:
+        for client in clients.values():
+            await client.close()
+
+
+async def extract_concurrently(
+    pool: ProviderPool,
+    emails: list[tuple[str, str]],
+    default_duration: int,
+) -> list[ExtractionResult]:
+    """Extract meetings from (subject, body) pairs with bounded parallelism.
+
+    At most llm.max_concurrency requests are in flight, hedged requests
+    included. Results keep the input order, and an extraction that raised
+    yields its exception.
+    """
+    slots = asyncio.Semaphore(max(pool.config.max_concurrency, 1))
+
+    async with provider_session(pool, slots) as complete:
+        async def _extract(subject: str, body: str) -> Optional[Meeting]:
+            response = await complete(build_extraction_prompt(subject, body))
+            return parse_llm_response(response, default_duration)
+
+        return await asyncio.gather(
+            *(_extract(subject, body) for subject, body in emails),
+            return_exceptions=True,
+        )
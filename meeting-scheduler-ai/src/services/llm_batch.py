@@ -0,0 +1,119 @@
+"""Batched extraction: several emails per prompt, answered as a JSON array."""
+
+import json
+from typing import Callable, Optional
+
+from src.models.meeting import Meeting
+from src.services.llm_prompt import meeting_from_fields
+from src.utils.tokens import estimate_tokens
+
+# Output tokens reserved per email in a batched answer
+OUTPUT_TOKENS_PER_EMAIL = 256
+
+BATCH_INSTRUCTIONS = """Extract meeting information from each of the following emails.
+Return a JSON array with exactly one object per email, each with these fields:
+- index: The email index shown in its header (required)
+- subject: Meeting title/subject
+- date: Meeting date in ISO format (YYYY-MM-DD)
+- time: Meeting time in 24h format (HH:MM)
+- duration_minutes: Duration in minutes (if specified)
+- description: Brief meeting description
+- location: Physical or virtual location (if specified)
+- attendees: List of email addresses (if specified)
+
+If any information is not found, omit that field from the object.
+"""
+
+
+def format_email(index: int, subject: str, body: str) -> str:
+    """Render one email section of a batched prompt."""
+    return f"\n=== Email {index} ===\nEmail Subject: {subject}\n\nEmail Body:\n{body}\n"
+
+
+def build_batch_prompt(emails: list[tuple[str, str]]) -> str:
+    """Build a prompt asking for one JSON object per (subject, body) pair."""
+    sections = "".join(
+        format_email(index, subject, body) for index, (subject, body) in enumerate(emails)
+    )
+    return f"{BATCH_INSTRUCTIONS}{sections}\nReturn ONLY the JSON array, no additional text.\n"
+
+
+def pack_batches(
+    emails: list[tuple[str, str]], max_emails: int, token_budget: int
+) -> list[list[int]]:
+    """Group email positions into batches bounded by count and prompt tokens.
+
+    An email too large for the budget on its own still gets a batch of one.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    used = estimate_tokens(BATCH_INSTRUCTIONS)
+    for position, (subject, body) in enumerate(emails):
+        cost = estimate_tokens(format_email(len(current), subject, body))
+        if current and (len(current) >= max_emails or used + cost > token_budget):
+            batches.append(current)
+            current = []
+            used = estimate_tokens(BATCH_INSTRUCTIONS)
+        current.append(position)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_batch_response(
+    response: str, count: int, default_duration: int
+) -> dict[int, Optional[Meeting]]:
+    """Map a batched answer back to per-email results keyed by batch index.
+
+    Indexes that are missing, duplicated, out of range or unparsable are left
+    out, so the caller can retry just those emails.
+    """
+    try:
+        items = json.loads(response[response.find("["):response.rfind("]") + 1])
+    except (json.JSONDecodeError, ValueError):
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    results: dict[int, Optional[Meeting]] = {}
+    seen: set[int] = set()
+    for item in items:
+        index = item.get("index") if isinstance(item, dict) else None
+        if not isinstance(index, int) or not 0 <= index < count:
+            continue
+        if index in seen:
+            results.pop(index, None)
+            continue
+        seen.add(index)
+        try:
+            results[index] = meeting_from_fields(item, default_duration)
+        except (ValueError, KeyError, TypeError):
+            continue
+    return results
+
+
+def extract_in_batches(
+    complete: Callable[[str, int], str],
+    emails: list[tuple[str, str]],
+    default_duration: int,
+    max_emails: int,
+    token_budget: int,
+) -> dict[int, Optional[Meeting]]:
+    """Extract (subject, body) pairs several at a time via complete(prompt, max_tokens).
+
+    Returns results keyed by position in emails. Positions missing from the
+    result (a malformed answer, or a request that failed) need a per-email retry.
+    """
+    resolved: dict[int, Optional[Meeting]] = {}
+    for batch in pack_batches(emails, max_emails, token_budget):
+        if len(batch) == 1:
+            continue
+        prompt = build_batch_prompt([emails[position] for position in batch])
+        try:
+            response = complete(prompt, OUTPUT_TOKENS_PER_EMAIL * len(batch))
+        except Exception:
+            continue
+        for index, meeting in parse_batch_response(response, len(batch), default_duration).items():
+            resolved[batch[index]] = meeting
+    return resolved
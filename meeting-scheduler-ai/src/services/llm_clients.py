@@ -0,0 +1,78 @@
+"""Provider client construction and completion calls (sync and async)."""
+
+from src.models.config import LLMConfig
+from src.services.llm_prompt import SYSTEM_PROMPT
+
+# Default Anthropic output limit; batched prompts may ask for more
+MAX_OUTPUT_TOKENS = 1024
+
+
+def create_client(config: LLMConfig):
+    """Create the client for the configured provider."""
+    # Retries are handled by the shared rate limiter
+    if config.provider == "openai":
+        from openai import OpenAI
+        return OpenAI(api_key=config.api_key, max_retries=0)
+    if config.provider == "anthropic":
+        from anthropic import Anthropic
+        return Anthropic(api_key=config.api_key, max_retries=0)
+    raise ValueError(f"Unsupported LLM provider: {config.provider}")
+
+
+def create_async_client(config: LLMConfig):
+    """Create the async client for the configured provider."""
+    if config.provider == "openai":
+        from openai import AsyncOpenAI
+        return AsyncOpenAI(api_key=config.api_key, max_retries=0)
+    if config.provider == "anthropic":
+        from anthropic import AsyncAnthropic
+        return AsyncAnthropic(api_key=config.api_key, max_retries=0)
+    raise ValueError(f"Unsupported LLM provider: {config.provider}")
+
+
+def _request(config: LLMConfig, prompt: str, max_tokens: int) -> dict:
+    """Keyword arguments for one completion request."""
+    if config.provider == "openai":
+        return {
+            "model": config.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0,
+        }
+    return {
+        "model": config.model,
+        "max_tokens": max(max_tokens, MAX_OUTPUT_TOKENS),
+        "messages": [
+            {"role": "user", "content": prompt}
+        ],
+    }
+
+
+def response_text(config: LLMConfig, response) -> str:
+    """Text answer of a completion response."""
+    if config.provider == "openai":
+        return response.choices[0].message.content
+    return response.content[0].text
+
+
+def completion_endpoint(client, config: LLMConfig):
+    """The create method for the provider's completion endpoint."""
+    if config.provider == "openai":
+        return client.chat.completions.create
+    return client.messages.create
+
+
+def call_provider(client, config: LLMConfig, prompt: str, max_tokens: int = MAX_OUTPUT_TOKENS) -> str:
+    """Send one prompt and return the text answer."""
+    response = completion_endpoint(client, config)(**_request(config, prompt, max_tokens))
+    return response_text(config, response)
+
+
+async def call_provider_async(
+    client, config: LLMConfig, prompt: str, max_tokens: int = MAX_OUTPUT_TOKENS
+) -> str:
+    """Send one prompt with the async client and return the text answer."""
+    response = await completion_endpoint(client, config)(**_request(config, prompt, max_tokens))
+    return response_text(config, response)
@@ -0,0 +1,100 @@
+"""Per-provider latency histograms and error health for LLM failover."""
+
+import bisect
+import threading
+import time
+from typing import Optional
+
+from src.models.config import LLMConfig
+
+# Upper bounds (seconds) of the histogram buckets: 50 ms growing by 25% to ~2 min
+BUCKET_BOUNDS = [0.05 * 1.25 ** i for i in range(36)]
+
+
+class LatencyHistogram:
+    """Fixed log-spaced buckets of request latencies."""
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.total = 0
+
+    def record(self, seconds: float) -> None:
+        """Count one observed latency."""
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.total += 1
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given percentile, or None if empty."""
+        if not self.total:
+            return None
+        rank = self.total * percent / 100.0
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return BUCKET_BOUNDS[min(index, len(BUCKET_BOUNDS) - 1)]
+        return BUCKET_BOUNDS[-1]
+
+
+class ProviderHealth:
+    """Latency and error tracking for one provider/model.
+
+    After failover_errors consecutive failures the provider is skipped for
+    cooldown_seconds unless no healthy provider remains.
+    """
+
+    def __init__(self, config: LLMConfig, failover_errors: int = 3, cooldown_seconds: float = 60.0):
+        """Initialize tracking for a provider configuration."""
+        self.config = config
+        self.name = f"{config.provider}:{config.model}"
+        self.key = (config.provider, config.model)
+        self.failover_errors = failover_errors
+        self.cooldown_seconds = cooldown_seconds
+        self.histogram = LatencyHistogram()
+        self.counters = {"requests": 0, "errors": 0, "wins": 0}
+        self._consecutive_errors = 0
+        self._down_until = 0.0
+        self._lock = threading.Lock()
+
+    def is_healthy(self) -> bool:
+        """Whether the provider is outside its failure cooldown."""
+        return time.monotonic() >= self._down_until
+
+    def hedge_delay(self, percent: float, min_samples: int) -> Optional[float]:
+        """Latency after which a hedged request is sent, or None until enough samples."""
+        with self._lock:
+            if self.histogram.total < min_samples:
+                return None
+            return self.histogram.percentile(percent)
+
+    def record_success(self, seconds: float) -> None:
+        """Record a completed request and its latency."""
+        with self._lock:
+            self.counters["requests"] += 1
+            self.histogram.record(seconds)
+            self._consecutive_errors = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request, starting a cooldown after repeated failures."""
+        with self._lock:
+            self.counters["requests"] += 1
+            self.counters["errors"] += 1
+            self._consecutive_errors += 1
+            if self._consecutive_errors >= self.failover_errors:
+                self._down_until = time.monotonic() + self.cooldown_seconds
+                self._consecutive_errors = 0
+
+    def record_win(self) -> None:
+        """Count a request whose answer was the one used."""
+        with self._lock:
+            self.counters["wins"] += 1
+
+    def get_counters(self) -> dict:
+        """Return request counts with p50/p95 latency in seconds."""
+        with self._lock:
+            return {
+                **self.counters,
+                "p50": self.histogram.percentile(50),
+                "p95": self.histogram.percentile(95),
+            }
@@ -0,0 +1,80 @@
+"""Prompt construction and response parsing for meeting extraction."""
+
+import json
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.models.meeting import Meeting
+
+# Bump whenever the extraction prompt or response parsing changes
+PROMPT_VERSION = "1"
+
+SYSTEM_PROMPT = "You are a meeting information extraction assistant."
+
+
+def build_extraction_prompt(subject: str, body: str) -> str:
+    """Build prompt for LLM to extract meeting details."""
+    return f"""Extract meeting information from the following email.
+Return a JSON object with these fields:
+- subject: Meeting title/subject
+- date: Meeting date in ISO format (YYYY-MM-DD)
+- time: Meeting time in 24h format (HH:MM)
+- duration_minutes: Duration in minutes (if specified)
+- description: Brief meeting description
+- location: Physical or virtual location (if specified)
+- attendees: List of email addresses (if specified)
+
+If any information is not found, omit that field from the JSON.
+
+Email Subject: {subject}
+
+Email Body:
+{body}
+
+Return ONLY the JSON object, no additional text.
+"""
+
+
+class MalformedResponseError(ValueError):
+    """The provider's answer was not a usable meeting JSON object."""
+
+
+def parse_llm_response(response: str, default_duration: int) -> Optional[Meeting]:
+    """Parse LLM response and create Meeting object.
+
+    Returns None when the answer parsed but held no date, and raises
+    MalformedResponseError when it could not be parsed.
+    """
+    try:
+        # Extract JSON from response
+        json_start = response.find("{")
+        json_end = response.rfind("}") + 1
+        data = json.loads(response[json_start:json_end])
+        if not isinstance(data, dict):
+            raise ValueError("answer is not a JSON object")
+        return meeting_from_fields(data, default_duration)
+    except (ValueError, KeyError, TypeError) as e:
+        raise MalformedResponseError(f"Malformed extraction answer: {e}") from e
+
+
+def meeting_from_fields(data: dict, default_duration: int) -> Optional[Meeting]:
+    """Create a Meeting from extracted JSON fields, or None without a date."""
+    # Parse datetime
+    date_str = data.get("date")
+    time_str = data.get("time", "09:00")
+
+    if not date_str:
+        return None
+
+    start_datetime = datetime.fromisoformat(f"{date_str}T{time_str}")
+    duration = data.get("duration_minutes", default_duration)
+    end_datetime = start_datetime + timedelta(minutes=duration)
+
+    return Meeting(
+        subject=data.get("subject", "Meeting"),
+        start_datetime=start_datetime,
+        end_datetime=end_datetime,
+        description=data.get("description", ""),
+        location=data.get("location"),
+        attendees=data.get("attendees"),
+    )
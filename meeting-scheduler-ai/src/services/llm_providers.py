@@ -0,0 +1,145 @@
+"""Hedged, failover-aware completion across one or more LLM providers."""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import replace
+from typing import Callable, Optional
+
+from src.models.config import LLMConfig
+from src.services.llm_clients import (
+    MAX_OUTPUT_TOKENS,
+    call_provider,
+    create_async_client,
+    create_client,
+)
+from src.services.llm_health import ProviderHealth
+from src.utils.rate_limiter import RateLimiter
+
+# Settings an llm.alternates entry may override; the rest come from llm
+PROVIDER_FIELDS = ("provider", "model", "api_key")
+
+
+class ProviderPool:
+    """The primary provider plus the alternates listed in llm.alternates.
+
+    A request goes to the first healthy provider. If it has not answered
+    within that provider's llm.hedge_percentile latency, the next provider
+    is asked as well and the first answer wins. A provider that fails is
+    replaced by the next one immediately, and repeated failures take it out
+    of rotation for a cooldown. With alternates, each provider gets a single
+    attempt (no backoff retries) so failover is not delayed.
+    """
+
+    def __init__(
+        self,
+        config: LLMConfig,
+        rate_limiter: RateLimiter,
+        client_factory: Callable = create_client,
+        async_client_factory: Callable = create_async_client,
+    ):
+        """Initialize providers and their clients from configuration.
+
+        The factories build a client from a provider's LLMConfig; replay
+        passes recording or replaying stand-ins here.
+        """
+        self.config = config
+        self.rate_limiter = rate_limiter
+        self.async_client_factory = async_client_factory
+        configs = [config] + [
+            replace(config, **{k: v for k, v in alt.items() if k in PROVIDER_FIELDS})
+            for alt in config.alternates
+        ]
+        self.providers = [
+            ProviderHealth(c, config.failover_errors, config.failover_cooldown_seconds)
+            for c in configs
+        ]
+        self.clients = {p.key: client_factory(p.config) for p in self.providers}
+        self.counters = {"hedges": 0, "failovers": 0}
+        # Rate limiter retries per provider call: its default, or none when failing over
+        self.retries = None if len(self.providers) == 1 else 0
+        # Threads for hedged requests, started on first use and stopped by close()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def ordered(self) -> list[ProviderHealth]:
+        """Healthy providers first, in configured order; cooling ones as a last resort."""
+        return sorted(self.providers, key=lambda p: not p.is_healthy())
+
+    def launch(
+        self, queue: list, pending: dict, last_error: Optional[Exception]
+    ) -> ProviderHealth:
+        """Take the next provider to ask, counting it as a hedge or a failover."""
+        if pending:
+            self.counters["hedges"] += 1
+        elif last_error is not None:
+            self.counters["failovers"] += 1
+        return queue.pop(0)
+
+    def hedge_delay(self, provider: ProviderHealth, remaining: list) -> Optional[float]:
+        """Seconds to wait before hedging, or None when no hedge is possible."""
+        if not remaining:
+            return None
+        return provider.hedge_delay(self.config.hedge_percentile, self.config.hedge_min_samples)
+
+    def _call(self, provider: ProviderHealth, prompt: str, max_tokens: int) -> str:
+        """Send one prompt to one provider, recording its latency or failure.
+
+        Only the SDK call is timed, so rate limiter waits stay out of the
+        latency histogram that sets the hedge delay.
+        """
+        client = self.clients[provider.key]
+
+        def request() -> str:
+            started = time.monotonic()
+            text = call_provider(client, provider.config, prompt, max_tokens)
+            provider.record_success(time.monotonic() - started)
+            return text
+
+        try:
+            return self.rate_limiter.call("llm", request, retries=self.retries)
+        except Exception:
+            provider.record_failure()
+            raise
+
+    def _submit(self, provider: ProviderHealth, prompt: str, max_tokens: int):
+        """Run _call on the hedging threads, starting them if needed."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=4 * len(self.providers))
+            return self._executor.submit(self._call, provider, prompt, max_tokens)
+
+    def complete(self, prompt: str, max_tokens: int = MAX_OUTPUT_TOKENS) -> str:
+        """Return the first answer from the providers, hedging and failing over."""
+        if len(self.providers) == 1:
+            return self._call(self.providers[0], prompt, max_tokens)
+        queue = self.ordered()
+        pending: dict = {}
+        last_error: Optional[Exception] = None
+        delay = None
+        while queue or pending:
+            if queue and (not pending or delay is not None):
+                provider = self.launch(queue, pending, last_error)
+                pending[self._submit(provider, prompt, max_tokens)] = provider
+                delay = self.hedge_delay(provider, queue)
+            done, _ = wait(pending, timeout=delay, return_when=FIRST_COMPLETED)
+            for future in done:
+                provider = pending.pop(future)
+                if future.exception() is None:
+                    provider.record_win()
+                    return future.result()
+                last_error = future.exception()
+            # Keep hedging only when the wait timed out (nothing finished)
+            delay = delay if not done else None
+        raise last_error
+
+    def close(self) -> None:
+        """Stop the hedging threads without waiting for abandoned requests."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def get_counters(self) -> dict:
+        """Return hedge/failover counts and per-provider latency statistics."""
+        return {**self.counters, "providers": {p.name: p.get_counters() for p in self.providers}}
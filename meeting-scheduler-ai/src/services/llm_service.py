@@ -1,32 +1,42 @@
 """LLM service for extracting meeting information."""
 
-import json
-from datetime import datetime, timedelta
+import asyncio
 from typing import Optional
 
 from src.models.meeting import Meeting
 from src.models.config import LLMConfig
+from src.services.llm_async import ExtractionResult, extract_concurrently
+from src.services.llm_batch import extract_in_batches
+from src.services.llm_clients import MAX_OUTPUT_TOKENS
+from src.services.llm_providers import ProviderPool
+from src.services.rule_extractor import extract_templated
+from src.services.llm_prompt import (
+    PROMPT_VERSION,
+    MalformedResponseError,
+    build_extraction_prompt,
+    parse_llm_response,
+)
+from src.utils.extraction_cache import ExtractionCache
+from src.utils.rate_limiter import RateLimiter
 
 
 class LLMService:
     """Service for interacting with LLM APIs."""
 
-    def __init__(self, config: LLMConfig):
+    def __init__(
+        self,
+        config: LLMConfig,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ExtractionCache] = None,
+        pool: Optional[ProviderPool] = None,
+    ):
         """Initialize LLM service with configuration."""
         self.config = config
-        self.client = None
-        self._initialize_client()
-
-    def _initialize_client(self) -> None:
-        """Initialize the appropriate LLM client based on provider."""
-        if self.config.provider == "openai":
-            from openai import OpenAI
-            self.client = OpenAI(api_key=self.config.api_key)
-        elif self.config.provider == "anthropic":
-            from anthropic import Anthropic
-            self.client = Anthropic(api_key=self.config.api_key)
-        else:
-            raise ValueError(f"Unsupported LLM provider: {self.config.provider}")
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache
+        self.pool = pool or ProviderPool(config, self.rate_limiter)
+        # How each extraction was answered: template rules, cache or provider
+        self.paths = {"rules": 0, "cache": 0, "llm": 0}
 
     def extract_meeting_info(
         self,
@@ -35,94 +45,104 @@ class LLMService:
         default_duration: int = 60
     ) -> Optional[Meeting]:
         """Extract meeting information from email using LLM."""
-        prompt = self._build_extraction_prompt(email_subject, email_body)
-
-        if self.config.provider == "openai":
-            response = self._call_openai(prompt)
-        elif self.config.provider == "anthropic":
-            response = self._call_anthropic(prompt)
+        result = self.extract_many([(email_subject, email_body)], default_duration)[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def extract_many(
+        self, emails: list[tuple[str, str]], default_duration: int = 60
+    ) -> list[ExtractionResult]:
+        """Extract meetings for many (subject, body) pairs, in input order.
+
+        Templated emails are answered by the rule-based parser when
+        llm.rule_fast_path is on. With llm.prompt_batch_size > 1, cache misses are first sent several to a
+        prompt; emails a batched answer did not cover are retried one at a time.
+        Up to llm.max_concurrency requests run at once on the async clients.
+        An item whose extraction raised holds the exception instead of a result.
+        """
+        results: list[ExtractionResult] = [None] * len(emails)
+        misses: list[tuple[int, Optional[str]]] = []
+        for index, (subject, body) in enumerate(emails):
+            hit, meeting, cache_key = self._lookup(subject, body, default_duration)
+            if hit:
+                results[index] = meeting
+            else:
+                misses.append((index, cache_key))
+
+        if self.config.prompt_batch_size > 1 and len(misses) > 1:
+            resolved = extract_in_batches(
+                self._complete, [emails[index] for index, _ in misses], default_duration,
+                self.config.prompt_batch_size, self.config.prompt_token_budget,
+            )
+            for position, meeting in resolved.items():
+                self._store(results, *misses[position], meeting)
+            misses = [miss for position, miss in enumerate(misses) if position not in resolved]
+
+        if self.config.max_concurrency > 1 and len(misses) > 1:
+            pairs = [emails[index] for index, _ in misses]
+            fetched = asyncio.run(
+                extract_concurrently(self.pool, pairs, default_duration)
+            )
         else:
+            fetched = [self._extract_isolated(*emails[index], default_duration) for index, _ in misses]
+
+        for miss, result in zip(misses, fetched):
+            self._store(results, *miss, result)
+        return results
+
+    def _store(
+        self, results: list, index: int, cache_key: Optional[str], result: ExtractionResult
+    ) -> None:
+        """Record one provider result, caching it unless it is an error or malformed."""
+        self.paths["llm"] += 1
+        if isinstance(result, MalformedResponseError):
+            # Recorded as no meeting, but not cached: the next run asks again
+            result = None
+        elif cache_key and not isinstance(result, Exception):
+            self.cache.put(cache_key, result)
+        results[index] = result
+
+    def _lookup(
+        self, subject: str, body: str, default_duration: int
+    ) -> tuple[bool, Optional[Meeting], Optional[str]]:
+        """Answer an email without the provider: (hit, meeting, cache key)."""
+        if self.config.rule_fast_path:
+            meeting = extract_templated(subject, body, default_duration)
+            if meeting:
+                self.paths["rules"] += 1
+                return True, meeting, None
+        cache_key = self._cache_key(subject, body, default_duration)
+        hit, meeting = self.cache.get(cache_key) if cache_key else (False, None)
+        if hit:
+            self.paths["cache"] += 1
+        return hit, meeting, cache_key
+
+    def _cache_key(self, subject: str, body: str, default_duration: int) -> Optional[str]:
+        """Cache key for an extraction, or None when caching is disabled."""
+        if not self.cache:
             return None
-
-        return self._parse_llm_response(response, default_duration)
-
-    def _build_extraction_prompt(self, subject: str, body: str) -> str:
-        """Build prompt for LLM to extract meeting details."""
-        return f"""Extract meeting information from the following email.
-Return a JSON object with these fields:
-- subject: Meeting title/subject
-- date: Meeting date in ISO format (YYYY-MM-DD)
-- time: Meeting time in 24h format (HH:MM)
-- duration_minutes: Duration in minutes (if specified)
-- description: Brief meeting description
-- location: Physical or virtual location (if specified)
-- attendees: List of email addresses (if specified)
-
-If any information is not found, omit that field from the JSON.
-
-Email Subject: {subject}
-
-Email Body:
-{body}
-
-Return ONLY the JSON object, no additional text.
-"""
-
-    def _call_openai(self, prompt: str) -> str:
-        """Call OpenAI API."""
-        response = self.client.chat.completions.create(
-            model=self.config.model,
-            messages=[
-                {"role": "system", "content": "You are a meeting information extraction assistant."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0,
-        )
-        return response.choices[0].message.content
-
-    def _call_anthropic(self, prompt: str) -> str:
-        """Call Anthropic API."""
-        response = self.client.messages.create(
-            model=self.config.model,
-            max_tokens=1024,
-            messages=[
-                {"role": "user", "content": prompt}
-            ],
+        return ExtractionCache.make_key(
+            self.config.provider, self.config.model, PROMPT_VERSION,
+            default_duration, subject, body,
         )
-        return response.content[0].text
 
-    def _parse_llm_response(
-        self,
-        response: str,
-        default_duration: int
-    ) -> Optional[Meeting]:
-        """Parse LLM response and create Meeting object."""
+    def _extract_isolated(
+        self, email_subject: str, email_body: str, default_duration: int
+    ) -> ExtractionResult:
+        """Extract one email without caching, returning any error instead of raising."""
         try:
-            # Extract JSON from response
-            json_start = response.find("{")
-            json_end = response.rfind("}") + 1
-            json_str = response[json_start:json_end]
-
-            data = json.loads(json_str)
-
-            # Parse datetime
-            date_str = data.get("date")
-            time_str = data.get("time", "09:00")
-
-            if not date_str:
-                return None
-
-            start_datetime = datetime.fromisoformat(f"{date_str}T{time_str}")
-            duration = data.get("duration_minutes", default_duration)
-            end_datetime = start_datetime + timedelta(minutes=duration)
-
-            return Meeting(
-                subject=data.get("subject", "Meeting"),
-                start_datetime=start_datetime,
-                end_datetime=end_datetime,
-                description=data.get("description", ""),
-                location=data.get("location"),
-                attendees=data.get("attendees"),
-            )
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
-            return None
+            return self._extract_uncached(email_subject, email_body, default_duration)
+        except Exception as e:
+            return e
+
+    def _extract_uncached(
+        self, email_subject: str, email_body: str, default_duration: int
+    ) -> Optional[Meeting]:
+        """Call the configured provider and parse its answer."""
+        prompt = build_extraction_prompt(email_subject, email_body)
+        return parse_llm_response(self._complete(prompt), default_duration)
+
+    def _complete(self, prompt: str, max_tokens: int = MAX_OUTPUT_TOKENS) -> str:
+        """Send one prompt to the configured providers, rate limited and hedged."""
+        return self.pool.complete(prompt, max_tokens)
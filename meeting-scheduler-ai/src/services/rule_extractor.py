@@ -0,0 +1,122 @@
+"""Rule-based extraction for templated meeting emails (no LLM call)."""
+
+import re
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from src.models.meeting import Meeting
+
+FIELD_PATTERN = re.compile(
+    r"^[ \t*-]*(date|time|when|duration|location|where)[ \t]*:[ \t]*(.+?)[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Start of quoted earlier mail in a reply or forward; fields below it are not this email's
+REPLY_MARKER = re.compile(
+    r"^[ \t]*(?:>|On .+ wrote:|-{2,}[ \t]*(?:Original|Forwarded) Message[ \t]*-{2,})",
+    re.IGNORECASE | re.MULTILINE,
+)
+WHEN_PATTERN = re.compile(r"^(.+?)\s+(?:at|@)\s+(.+)$", re.IGNORECASE)
+DURATION_PATTERN = re.compile(
+    r"^(\d+(?:\.\d+)?)\s*(minutes?|mins?|m|hours?|hrs?|h)\b", re.IGNORECASE
+)
+# Longest duration accepted from a template (one week)
+MAX_DURATION_MINUTES = 7 * 24 * 60
+
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%B %d, %Y",
+    "%b %d, %Y",
+    "%B %d %Y",
+    "%b %d %Y",
+    "%A, %B %d, %Y",
+    "%a, %b %d, %Y",
+    "%d %B %Y",
+    "%m/%d/%Y",
+)
+TIME_FORMATS = ("%I:%M %p", "%I:%M%p", "%I %p", "%I%p", "%H:%M")
+
+
+def _parse_with(value: str, formats: tuple[str, ...]) -> Optional[datetime]:
+    """Parse value with the first matching strptime format."""
+    value = " ".join(value.replace(".", "").split())
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_date(value: str) -> Optional[date]:
+    """Parse a calendar date written in one of the common email layouts."""
+    parsed = _parse_with(value, DATE_FORMATS)
+    return parsed.date() if parsed else None
+
+
+def parse_time(value: str) -> Optional[time]:
+    """Parse a clock time such as '2:00 PM' or '14:00'."""
+    parsed = _parse_with(value, TIME_FORMATS)
+    return parsed.time() if parsed else None
+
+
+def parse_duration(value: str) -> Optional[int]:
+    """Parse a duration such as '90 minutes' or '1.5 hours' into minutes."""
+    match = DURATION_PATTERN.match(value.strip())
+    if not match:
+        return None
+    amount = float(match.group(1))
+    minutes = amount if match.group(2).lower().startswith("m") else amount * 60
+    return int(minutes) if 0 < minutes <= MAX_DURATION_MINUTES else None
+
+
+def _fields(body: str) -> Optional[dict[str, str]]:
+    """Collect labelled field lines, or None when a label is contradictory."""
+    fields: dict[str, str] = {}
+    marker = REPLY_MARKER.search(body)
+    for match in FIELD_PATTERN.finditer(body[:marker.start()] if marker else body):
+        name = match.group(1).lower()
+        name = "location" if name == "where" else name
+        if fields.get(name, match.group(2)) != match.group(2):
+            return None
+        fields[name] = match.group(2)
+    return fields
+
+
+def extract_templated(subject: str, body: str, default_duration: int) -> Optional[Meeting]:
+    """Build a Meeting from Date/Time/Duration/Location lines.
+
+    Returns None unless both the date and the start time parse cleanly, so
+    free-form emails fall through to the LLM.
+    """
+    fields = _fields(body)
+    if not fields:
+        return None
+
+    date_text, time_text = fields.get("date"), fields.get("time")
+    when = WHEN_PATTERN.match(fields.get("when", ""))
+    if when:
+        date_text, time_text = date_text or when.group(1), time_text or when.group(2)
+    if not date_text or not time_text:
+        return None
+
+    day, start = parse_date(date_text), parse_time(time_text)
+    if not day or not start:
+        return None
+    duration = default_duration
+    if "duration" in fields:
+        duration = parse_duration(fields["duration"])
+        if duration is None:
+            return None
+
+    start_datetime = datetime.combine(day, start)
+    try:
+        end_datetime = start_datetime + timedelta(minutes=duration)
+    except OverflowError:
+        return None
+    return Meeting(
+        subject=subject or "Meeting",
+        start_datetime=start_datetime,
+        end_datetime=end_datetime,
+        description="",
+        location=fields.get("location"),
+    )
@@ -0,0 +1,51 @@
+"""Compact Bloom filter for string membership tests."""
+
+import math
+import sys
+from typing import Iterable
+
+# Second hash input, independent of the first
+SALT = "bloom"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter: no false negatives, tunable false positives.
+
+    Bit positions come from double hashing with Python's built-in hash.
+    That hash is salted per process, so a filter is only valid in the
+    process that built it (it is never persisted).
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """Size the filter for capacity items at the given false-positive rate."""
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        h1 = hash(item)
+        h2 = hash((item, SALT)) | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str) -> None:
+        """Add an item."""
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        """False if the item was definitely never added; True if it may have been."""
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    def is_full(self) -> bool:
+        """Whether more items were added than the filter was sized for."""
+        return self.count > self.capacity
+
+    def memory_bytes(self) -> int:
+        """Memory used by the bit array."""
+        return sys.getsizeof(self.bits)
@@ -0,0 +1,94 @@
+"""Shrink email bodies before they are sent to the LLM."""
+
+import re
+
+from src.utils.meeting_classifier import PATTERNS
+from src.utils.tokens import CHARS_PER_TOKEN
+
+# Lines that start quoted history; everything after them is dropped
+REPLY_MARKERS = re.compile(
+    r"^\s*(on .+ wrote:|-{2,}\s*original message\s*-{2,}|"
+    r"-{2,}\s*forwarded message\s*-{2,}|begin forwarded message:|"
+    r"from: .+ sent: .+|_{10,})\s*$",
+    re.IGNORECASE,
+)
+# Signature delimiters and mobile sign-offs; everything after them is dropped
+SIGNATURE_MARKERS = re.compile(
+    r"^\s*(--\s*|sent from my \w+.*|get outlook for \w+.*)$", re.IGNORECASE
+)
+FOOTER_PATTERN = re.compile(
+    r"confidential|intended recipient|disclaimer|unsubscribe|privileged|"
+    r"do not reply|manage (your )?(email )?preferences",
+    re.IGNORECASE,
+)
+SPACES = re.compile(r"[ \t\u00a0]+")
+
+# Marker text kept where content was cut for the token budget
+TRUNCATED = "[...]"
+
+
+def _strip_history(lines: list[str]) -> list[str]:
+    """Drop quoted lines and cut at the first reply/forward or signature marker.
+
+    A marker with nothing written above it is kept, since what follows
+    (a forwarded message, or text after a leading "-- ") is then the only
+    content.
+    """
+    kept: list[str] = []
+    for line in lines:
+        if line.lstrip().startswith(">"):
+            continue
+        if (SIGNATURE_MARKERS.match(line) or REPLY_MARKERS.match(line)) and any(kept):
+            break
+        kept.append(line)
+    return kept
+
+
+def _mentions_schedule(text: str) -> bool:
+    """Whether text has a date, time or other scheduling detail."""
+    return any(pattern.search(text) for pattern in PATTERNS.values())
+
+
+def _drop_footers(text: str) -> str:
+    """Remove legal or mailing-list footer paragraphs that follow the main content.
+
+    Only the trailing run of footer-like paragraphs goes, never the first
+    paragraph, and never a paragraph with scheduling details.
+    """
+    paragraphs = re.split(r"\n\s*\n", text)
+    end = len(paragraphs)
+    while end > 1:
+        last = paragraphs[end - 1]
+        if not FOOTER_PATTERN.search(last) or _mentions_schedule(last):
+            break
+        end -= 1
+    return "\n\n".join(paragraphs[:end])
+
+
+def _fit_budget(lines: list[str], max_chars: int) -> list[str]:
+    """Keep lines within max_chars, favouring lines that mention dates or times.
+
+    Kept lines stay in their original order.
+    """
+    scheduling = [i for i, line in enumerate(lines) if _mentions_schedule(line)]
+    others = sorted(set(range(len(lines))) - set(scheduling))
+    chosen: set[int] = set()
+    used = len(TRUNCATED)
+    for i in scheduling + others:
+        if used + len(lines[i]) + 1 > max_chars:
+            continue
+        chosen.add(i)
+        used += len(lines[i]) + 1
+    return [lines[i] for i in sorted(chosen)] + [TRUNCATED]
+
+
+def compact_body(body: str, token_budget: int) -> str:
+    """Strip history, signatures and footers, collapse whitespace and cap length."""
+    lines = [SPACES.sub(" ", line).strip() for line in _strip_history(body.splitlines())]
+    text = _drop_footers("\n".join(lines))
+    text = re.sub(r"\n{3,}", "\n\n", text).strip()
+
+    max_chars = token_budget * CHARS_PER_TOKEN
+    if token_budget <= 0 or len(text) <= max_chars:
+        return text
+    return "\n".join(_fit_budget(text.splitlines(), max_chars))
@@ -0,0 +1,81 @@
+"""SQLite mirror of Google Calendar events kept current with sync tokens."""
+
+from datetime import datetime
+from typing import Optional
+
+from src.services.calendar_mirror import parse_event_time
+from src.utils.sqlite_db import SQLiteDatabase
+from src.utils.storage_schema import migrate
+
+
+class CalendarStore(SQLiteDatabase):
+    """SQLite-based local copy of calendar events, on the shared connection."""
+
+    def __init__(self, db_path: str):
+        """Initialize store with database path."""
+        super().__init__(db_path)
+        with self.transaction():
+            migrate(self._conn)
+
+    def apply_events(self, calendar_id: str, events: list[dict]) -> None:
+        """Upsert changed events and delete cancelled ones in one transaction."""
+        upserts = []
+        deletes = []
+        for event in events:
+            if event.get("status") == "cancelled" or "start" not in event:
+                deletes.append((calendar_id, event["id"]))
+                continue
+            upserts.append((
+                calendar_id,
+                event["id"],
+                event.get("summary", ""),
+                parse_event_time(event["start"]).isoformat(),
+                parse_event_time(event["end"]).isoformat(),
+            ))
+
+        with self.transaction():
+            self._write_many(
+                "DELETE FROM calendar_events WHERE calendar_id = ? AND event_id = ?", deletes
+            )
+            self._write_many(
+                """
+                INSERT OR REPLACE INTO calendar_events
+                (calendar_id, event_id, summary, start_utc, end_utc)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                upserts
+            )
+
+    def list_events(self, calendar_id: str, time_min: datetime, time_max: datetime) -> list[dict]:
+        """List stored events overlapping a naive UTC range, in Calendar API shape."""
+        rows = self._fetchall(
+            """
+            SELECT event_id, summary, start_utc, end_utc FROM calendar_events
+            WHERE calendar_id = ? AND start_utc < ? AND end_utc > ?
+            """,
+            (calendar_id, time_max.isoformat(), time_min.isoformat())
+        )
+        return [
+            {"id": row[0], "summary": row[1], "start": {"dateTime": row[2]}, "end": {"dateTime": row[3]}}
+            for row in rows
+        ]
+
+    def get_sync_token(self, calendar_id: str) -> Optional[str]:
+        """Get the stored sync token for a calendar."""
+        row = self._fetchone(
+            "SELECT sync_token FROM calendar_sync WHERE calendar_id = ?", (calendar_id,)
+        )
+        return row[0] if row else None
+
+    def set_sync_token(self, calendar_id: str, sync_token: str) -> None:
+        """Store the sync token reached by the last sync."""
+        self._write(
+            "INSERT OR REPLACE INTO calendar_sync (calendar_id, sync_token) VALUES (?, ?)",
+            (calendar_id, sync_token)
+        )
+
+    def reset(self, calendar_id: str) -> None:
+        """Drop all stored events and the sync token for a calendar."""
+        with self.transaction():
+            self._write("DELETE FROM calendar_events WHERE calendar_id = ?", (calendar_id,))
+            self._write("DELETE FROM calendar_sync WHERE calendar_id = ?", (calendar_id,))
@@ -2,6 +2,7 @@
 
 import os
 import yaml
+from dataclasses import fields
 from pathlib import Path
 from typing import Any
 from dotenv import load_dotenv
@@ -12,7 +13,11 @@ from src.models.config import (
     GmailFilters,
     CalendarConfig,
     LLMConfig,
+    ClassifierConfig,
+    NearDuplicateConfig,
+    ReplayConfig,
     AgentConfig,
+    RateLimitConfig,
     StorageConfig,
     LoggingConfig,
 )
@@ -45,20 +50,19 @@ def load_config(config_path: str = "config.yaml") -> AppConfig:
     config_data = _substitute_env_in_dict(config_data)
 
     # Parse configuration sections
-    gmail_config = _parse_gmail_config(config_data.get("gmail", {}))
-    calendar_config = _parse_calendar_config(config_data.get("calendar", {}))
-    llm_config = _parse_llm_config(config_data.get("llm", {}))
-    agent_config = _parse_agent_config(config_data.get("agent", {}))
-    storage_config = _parse_storage_config(config_data.get("storage", {}))
-    logging_config = _parse_logging_config(config_data.get("logging", {}))
-
     return AppConfig(
-        gmail=gmail_config,
-        calendar=calendar_config,
-        llm=llm_config,
-        agent=agent_config,
-        storage=storage_config,
-        logging=logging_config,
+        gmail=_parse_gmail_config(config_data.get("gmail", {})),
+        calendar=_parse_section(CalendarConfig, config_data.get("calendar", {})),
+        llm=_parse_section(LLMConfig, config_data.get("llm", {})),
+        classifier=_parse_section(ClassifierConfig, config_data.get("classifier", {})),
+        near_duplicates=_parse_section(
+            NearDuplicateConfig, config_data.get("near_duplicates", {})
+        ),
+        replay=_parse_section(ReplayConfig, config_data.get("replay", {})),
+        agent=_parse_section(AgentConfig, config_data.get("agent", {})),
+        rate_limits=_parse_section(RateLimitConfig, config_data.get("rate_limits", {})),
+        storage=_parse_section(StorageConfig, config_data.get("storage", {})),
+        logging=_parse_section(LoggingConfig, config_data.get("logging", {})),
     )
 
 
@@ -69,58 +73,23 @@ def _substitute_env_in_dict(data: dict) -> dict:
         if isinstance(value, dict):
             result[key] = _substitute_env_in_dict(value)
         elif isinstance(value, list):
-            result[key] = [substitute_env_vars(item) for item in value]
+            result[key] = [
+                _substitute_env_in_dict(item) if isinstance(item, dict) else substitute_env_vars(item)
+                for item in value
+            ]
         else:
             result[key] = substitute_env_vars(value)
     return result
 
 
-def _parse_gmail_config(data: dict) -> GmailConfig:
-    """Parse Gmail configuration section."""
-    filters_data = data.get("filters", {})
-    filters = GmailFilters(
-        senders=filters_data.get("senders", []),
-        subject_keywords=filters_data.get("subject_keywords", []),
-        labels=filters_data.get("labels", []),
-        read_status=filters_data.get("read_status", "any"),
-    )
-    return GmailConfig(filters=filters)
-
-
-def _parse_calendar_config(data: dict) -> CalendarConfig:
-    """Parse Calendar configuration section."""
-    return CalendarConfig(
-        calendar_id=data.get("calendar_id", "primary"),
-        default_duration_minutes=data.get("default_duration_minutes", 60),
-    )
-
-
-def _parse_llm_config(data: dict) -> LLMConfig:
-    """Parse LLM configuration section."""
-    return LLMConfig(
-        provider=data.get("provider", "openai"),
-        model=data.get("model", "gpt-4"),
-        api_key=data.get("api_key", ""),
-    )
-
-
-def _parse_agent_config(data: dict) -> AgentConfig:
-    """Parse Agent configuration section."""
-    return AgentConfig(
-        schedule_interval_minutes=data.get("schedule_interval_minutes", 30),
-        max_emails_per_run=data.get("max_emails_per_run", 50),
-        mark_as_read_after_processing=data.get("mark_as_read_after_processing", True),
-    )
-
+def _parse_section(section_class: type, data: dict) -> Any:
+    """Build a configuration dataclass, using field defaults for missing keys."""
+    names = {f.name for f in fields(section_class)}
+    return section_class(**{key: value for key, value in data.items() if key in names})
 
-def _parse_storage_config(data: dict) -> StorageConfig:
-    """Parse Storage configuration section."""
-    return StorageConfig(database_path=data.get("database_path", "./data/processed_emails.db"))
 
-
-def _parse_logging_config(data: dict) -> LoggingConfig:
-    """Parse Logging configuration section."""
-    return LoggingConfig(
-        level=data.get("level", "INFO"),
-        file_path=data.get("file_path", "./logs/agent.log"),
-    )
+def _parse_gmail_config(data: dict) -> GmailConfig:
+    """Parse Gmail configuration section."""
+    gmail_config = _parse_section(GmailConfig, {k: v for k, v in data.items() if k != "filters"})
+    gmail_config.filters = _parse_section(GmailFilters, data.get("filters", {}))
+    return gmail_config
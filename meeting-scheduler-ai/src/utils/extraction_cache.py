@@ -0,0 +1,129 @@
+"""Content-addressed cache of LLM meeting extractions."""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from src.models.meeting import Meeting
+from src.utils.sqlite_db import SQLiteDatabase
+
+
+class ExtractionCache(SQLiteDatabase):
+    """Two-tier cache: in-memory LRU in front of a SQLite table.
+
+    Entries expire after ttl_seconds. The SQLite tier is trimmed to
+    max_entries, dropping the least recently used rows first, once a put
+    takes it over the limit. A cached value of None records that the
+    email held no meeting.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: float = 30 * 24 * 3600,
+        max_entries: int = 10000,
+        memory_entries: int = 256,
+    ):
+        """Initialize cache with database path and eviction limits."""
+        super().__init__(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict[str, tuple[float, Optional[dict]]] = OrderedDict()
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        self._ensure_database_exists()
+        # Upper bound on the table's rows (replaced keys are counted again)
+        self._rows = self._fetchone("SELECT COUNT(*) FROM llm_cache")[0]
+
+    def _ensure_database_exists(self) -> None:
+        """Create the table and its eviction index if they don't exist."""
+        with self.transaction():
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    payload TEXT,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used)"
+            )
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Hash the inputs that determine an extraction result."""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> tuple[bool, Optional[Meeting]]:
+        """Look up a key, returning (hit, meeting)."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and now - entry[0] < self.ttl_seconds:
+                self._memory.move_to_end(key)
+                self.counters["memory_hits"] += 1
+                return True, Meeting.from_dict(entry[1]) if entry[1] else None
+
+            with self.transaction():
+                row = self._fetchone(
+                    "SELECT payload, created_at FROM llm_cache WHERE cache_key = ?", (key,)
+                )
+                if row and now - row[1] < self.ttl_seconds:
+                    self._write("UPDATE llm_cache SET last_used = ? WHERE cache_key = ?", (now, key))
+                elif row:
+                    self._write("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+                    self._rows -= 1
+                    row = None
+
+            if row is None:
+                self.counters["misses"] += 1
+                return False, None
+            self.counters["disk_hits"] += 1
+            payload = json.loads(row[0])
+            self._remember(key, row[1], payload)
+        return True, Meeting.from_dict(payload) if payload else None
+
+    def put(self, key: str, meeting: Optional[Meeting]) -> None:
+        """Store an extraction result, evicting old entries beyond max_entries."""
+        now = time.time()
+        payload = meeting.to_dict() if meeting else None
+
+        with self.transaction():
+            self._write(
+                "INSERT OR REPLACE INTO llm_cache (cache_key, payload, created_at, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(payload), now, now)
+            )
+            self._rows += 1
+            if self._rows > self.max_entries:
+                self._evict()
+            self._remember(key, now, payload)
+
+    def get_counters(self) -> dict:
+        """Return a snapshot of hit, miss and eviction counters."""
+        with self._lock:
+            return dict(self.counters)
+
+    def _evict(self) -> None:
+        """Drop the least recently used rows beyond max_entries."""
+        evicted = self._conn.execute(
+            "DELETE FROM llm_cache WHERE cache_key IN ("
+            "SELECT cache_key FROM llm_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        ).rowcount
+        self.counters["evictions"] += max(evicted, 0)
+        self._rows = self._fetchone("SELECT COUNT(*) FROM llm_cache")[0]
+
+    def _remember(self, key: str, created_at: float, payload: Optional[dict]) -> None:
+        """Add an entry to the memory tier, dropping the least recently used."""
+        self._memory[key] = (created_at, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
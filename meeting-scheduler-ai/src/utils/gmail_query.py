@@ -0,0 +1,48 @@
+"""Compilation of GmailFilters into Gmail server-side list parameters."""
+
+from src.models.config import GmailFilters
+
+
+def compile_gmail_query(filters: GmailFilters) -> dict:
+    """Build messages().list parameters (q, labelIds) from filters.
+
+    Every clause is at least as broad as the matching Email.matches_* check,
+    and filter_emails still runs on the fetched mail as the exact check.
+    Subject keywords are not pushed down: Gmail matches whole words, while
+    matches_subject_filter matches substrings ("sync" in "async").
+    """
+    clauses = []
+    params = {}
+
+    if filters.senders:
+        clauses.append(_any_of("from", filters.senders))
+
+    if len(filters.labels) == 1:
+        # labelIds requires all listed labels, so only a single label maps exactly
+        params["labelIds"] = list(filters.labels)
+
+    if filters.read_status == "unread":
+        clauses.append("is:unread")
+    elif filters.read_status == "read":
+        clauses.append("-is:unread")
+
+    if clauses:
+        params["q"] = " ".join(clauses)
+
+    return params
+
+
+def _any_of(operator: str, values: list[str]) -> str:
+    """Build an OR group of operator:value terms."""
+    terms = [f"{operator}:{_quote(value)}" for value in values]
+    if len(terms) == 1:
+        return terms[0]
+    return "{" + " ".join(terms) + "}"
+
+
+def _quote(value: str) -> str:
+    """Quote a search value if it contains spaces or query syntax."""
+    if any(char in value for char in ' "(){}:'):
+        escaped = value.replace('"', "")
+        return f'"{escaped}"'
+    return value
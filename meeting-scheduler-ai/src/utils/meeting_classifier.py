@@ -0,0 +1,84 @@
+"""Local scoring of how likely an email is to hold a meeting (no network)."""
+
+import json
+import math
+import re
+from typing import Optional
+
+from src.models.email import Email
+
+# Weights of a logistic score; a JSON file with the same shape can replace them
+DEFAULT_WEIGHTS = {
+    "bias": -2.0,
+    "keywords": {
+        "meeting": 1.2, "meet": 0.8, "call": 0.6, "sync": 0.8, "schedule": 1.0,
+        "scheduled": 1.0, "agenda": 1.0, "invite": 0.8, "invitation": 0.8,
+        "appointment": 1.2, "1-on-1": 1.0, "standup": 1.0, "interview": 0.8,
+        "zoom": 0.8, "teams": 0.4, "conference": 0.6,
+        "unsubscribe": -1.5, "newsletter": -1.5, "receipt": -1.2, "invoice": -1.0,
+        "order": -0.6, "sale": -1.0,
+    },
+    "patterns": {
+        "date": 1.5, "time": 1.5, "weekday": 0.6, "duration": 0.8, "labelled_field": 1.0,
+    },
+}
+
+PATTERNS = {
+    "date": re.compile(
+        r"\b(\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}(/\d{2,4})?|"
+        r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.? \d{1,2})\b",
+        re.IGNORECASE,
+    ),
+    "time": re.compile(r"\b(\d{1,2}(:\d{2})?\s?(am|pm)|[01]?\d:[0-5]\d|2[0-3]:[0-5]\d)\b", re.IGNORECASE),
+    "weekday": re.compile(r"\b(mon|tues|wednes|thurs|fri|satur|sun)day\b|\btomorrow\b", re.IGNORECASE),
+    "duration": re.compile(r"\b\d+(\.\d+)?\s*(minutes?|mins?|hours?|hrs?)\b", re.IGNORECASE),
+    "labelled_field": re.compile(r"^\s*(date|time|when|where|location)\s*:", re.IGNORECASE | re.MULTILINE),
+}
+WORD_PATTERN = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+
+
+class MeetingClassifier:
+    """Weighted keyword and date-pattern scoring with shadow-mode metrics."""
+
+    def __init__(self, threshold: float = 0.5, weights: Optional[dict] = None):
+        """Initialize classifier with a score threshold and optional weights."""
+        self.threshold = threshold
+        self.weights = weights or DEFAULT_WEIGHTS
+        # Predictions compared with the extraction outcome (shadow mode)
+        self.counters = {"true_pos": 0, "false_pos": 0, "false_neg": 0, "true_neg": 0}
+
+    @classmethod
+    def from_file(cls, path: str, threshold: float = 0.5) -> "MeetingClassifier":
+        """Load weights from a JSON file shaped like DEFAULT_WEIGHTS."""
+        with open(path, "r") as f:
+            return cls(threshold, json.load(f))
+
+    def score(self, email: Email) -> float:
+        """Probability-like score in [0, 1] that the email holds a meeting."""
+        text = f"{email.subject}\n{email.get_plain_text_body()}"
+        words = set(WORD_PATTERN.findall(text.lower()))
+        total = self.weights.get("bias", 0.0)
+        total += sum(w for word, w in self.weights.get("keywords", {}).items() if word in words)
+        for name, weight in self.weights.get("patterns", {}).items():
+            if name in PATTERNS and PATTERNS[name].search(text):
+                total += weight
+        return 1.0 / (1.0 + math.exp(-total))
+
+    def is_meeting(self, email: Email) -> bool:
+        """Whether the email scores at or above the threshold."""
+        return self.score(email) >= self.threshold
+
+    def record(self, predicted: bool, actual: bool) -> None:
+        """Count one prediction against the extraction outcome."""
+        key = ("true_" if predicted == actual else "false_") + ("pos" if predicted else "neg")
+        self.counters[key] += 1
+
+    def get_counters(self) -> dict:
+        """Return confusion counts with precision and recall (None when undefined)."""
+        c = self.counters
+        predicted, actual = c["true_pos"] + c["false_pos"], c["true_pos"] + c["false_neg"]
+        return {
+            **c,
+            "precision": round(c["true_pos"] / predicted, 3) if predicted else None,
+            "recall": round(c["true_pos"] / actual, 3) if actual else None,
+        }
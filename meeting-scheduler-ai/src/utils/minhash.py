@@ -0,0 +1,66 @@
+"""MinHash signatures and LSH band keys for near-duplicate text detection."""
+
+import hashlib
+import random
+import re
+from array import array
+
+WORD_PATTERN = re.compile(r"\w+")
+# Mersenne prime for the universal hash family (a * x + b) mod p
+PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+SHINGLE_SIZE = 3
+
+
+def _hash64(value: str) -> int:
+    """Stable 64-bit hash (Python's hash() is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[int]:
+    """Hashed word n-grams of the lower-cased text."""
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) < size:
+        return {_hash64(" ".join(words))} if words else set()
+    return {_hash64(" ".join(words[i:i + size])) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """Computes fixed-length MinHash signatures and their LSH band keys."""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, seed: int = 1):
+        """Initialize with signature length, band count and permutation seed."""
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, PRIME), rng.randrange(0, PRIME)) for _ in range(num_perm)
+        ]
+
+    def signature(self, text: str) -> array:
+        """MinHash signature of the text as an array of unsigned 32-bit values."""
+        values = shingles(text)
+        if not values:
+            return array("I", [MAX_HASH] * self.num_perm)
+        return array("I", [
+            min(((a * x + b) % PRIME) & MAX_HASH for x in values) for a, b in self._perms
+        ])
+
+    def band_keys(self, signature: array) -> list[int]:
+        """One signed 64-bit bucket key per band (fits an SQLite INTEGER)."""
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            digest = hashlib.blake2b(chunk, digest_size=8).digest()
+            keys.append(int.from_bytes(digest, "big", signed=True))
+        return keys
+
+    @staticmethod
+    def similarity(first: array, second: array) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        if not first or len(first) != len(second):
+            return 0.0
+        return sum(a == b for a, b in zip(first, second)) / len(first)
@@ -0,0 +1,109 @@
+"""Persistent MinHash/LSH index of email bodies for near-duplicate lookup."""
+
+import hashlib
+import time
+from array import array
+from typing import Optional
+
+from src.utils.meeting_classifier import PATTERNS
+from src.utils.minhash import MinHasher
+from src.utils.sqlite_db import SQLiteDatabase
+from src.utils.storage_schema import migrate
+
+
+def schedule_fingerprint(text: str) -> str:
+    """Hash of the lines mentioning dates or times.
+
+    Two emails only count as duplicates when these lines match, so a
+    reschedule notice is never mistaken for the original invitation.
+    """
+    lines = [
+        " ".join(line.lower().split()) for line in text.splitlines()
+        if any(pattern.search(line) for pattern in PATTERNS.values())
+    ]
+    return hashlib.sha1("\n".join(lines).encode("utf-8")).hexdigest()[:16]
+
+
+class NearDuplicateIndex(SQLiteDatabase):
+    """MinHash signatures with LSH band buckets, stored in the SQLite database.
+
+    A lookup only reads the buckets of the query's bands (one indexed query
+    per band) and compares at most max_candidates signatures, so its cost
+    does not grow with the number of stored emails. Lookups and writes go
+    through one shared connection; retention prunes the entries of
+    archived emails.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        threshold: float = 0.8,
+        num_perm: int = 64,
+        bands: int = 16,
+        max_candidates: int = 50,
+    ):
+        """Initialize index with database path and LSH parameters."""
+        super().__init__(db_path)
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        self.hasher = MinHasher(num_perm, bands)
+        self.counters = {"lookups": 0, "candidates": 0, "duplicates": 0}
+        with self.transaction():
+            migrate(self._conn)
+
+    def find_or_add(self, email_id: str, text: str) -> Optional[str]:
+        """Return the ID of a stored near-duplicate, or store this email and return None."""
+        signature = self.hasher.signature(text)
+        schedule = schedule_fingerprint(text)
+        keys = self.hasher.band_keys(signature)
+
+        with self.transaction():
+            self.counters["lookups"] += 1
+            match = self._best_match(email_id, signature, schedule, keys)
+            if match:
+                self.counters["duplicates"] += 1
+                return match
+            self._conn.execute(
+                "INSERT OR REPLACE INTO near_dup_signatures VALUES (?, ?, ?, ?)",
+                (email_id, signature.tobytes(), schedule, time.time()),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO near_dup_buckets VALUES (?, ?, ?)",
+                [(band, key, email_id) for band, key in enumerate(keys)],
+            )
+        return None
+
+    def _best_match(
+        self, email_id: str, signature: array, schedule: str, keys: list[int]
+    ) -> Optional[str]:
+        """Most similar stored email above the threshold with the same schedule lines."""
+        candidates: list[str] = []
+        for band, key in enumerate(keys):
+            rows = self._fetchall(
+                "SELECT email_id FROM near_dup_buckets WHERE band = ? AND bucket = ? LIMIT ?",
+                (band, key, self.max_candidates),
+            )
+            candidates.extend(row[0] for row in rows if row[0] != email_id)
+        candidates = list(dict.fromkeys(candidates))[:self.max_candidates]
+        self.counters["candidates"] += len(candidates)
+        if not candidates:
+            return None
+
+        placeholders = ",".join("?" * len(candidates))
+        rows = self._fetchall(
+            f"SELECT email_id, signature FROM near_dup_signatures "
+            f"WHERE schedule = ? AND email_id IN ({placeholders})",
+            (schedule, *candidates),
+        )
+        best, best_score = None, self.threshold
+        for candidate_id, blob in rows:
+            stored = array("I")
+            stored.frombytes(blob)
+            score = MinHasher.similarity(signature, stored)
+            if score >= best_score:
+                best, best_score = candidate_id, score
+        return best
+
+    def get_counters(self) -> dict:
+        """Return lookup, candidate and duplicate counts."""
+        return dict(self.counters)
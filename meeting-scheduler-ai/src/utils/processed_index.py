@@ -0,0 +1,75 @@
+"""In-memory Bloom filter index of processed email IDs."""
+
+import threading
+from typing import Callable, Iterable, Optional
+
+from src.utils.bloom_filter import BloomFilter
+
+# Smallest filter built, and headroom over the stored IDs when (re)building
+MIN_CAPACITY = 10_000
+GROWTH_FACTOR = 2
+
+
+class ProcessedIdIndex:
+    """Bloom filter front for processed-email lookups.
+
+    IDs the filter rules out are definitely unprocessed and need no query;
+    only possible positives go to the exact lookup in SQLite. The filter is
+    built on first use from load_ids(), kept in sync by add(), and rebuilt
+    larger once it holds more IDs than it was sized for.
+    """
+
+    def __init__(self, load_ids: Callable[[], Iterable[str]], count_ids: Callable[[], int],
+                 error_rate: float = 0.01):
+        """Initialize index with callables that stream and count the stored IDs."""
+        self.load_ids = load_ids
+        self.count_ids = count_ids
+        self.error_rate = error_rate
+        self._bloom: Optional[BloomFilter] = None
+        self._lock = threading.Lock()
+        self.counters = {"builds": 0, "definite_negatives": 0, "possible_positives": 0,
+                         "false_positives": 0}
+
+    def _ensure_built(self) -> BloomFilter:
+        """Return the filter, building it from storage if missing or full."""
+        if self._bloom is None or self._bloom.is_full():
+            capacity = max(MIN_CAPACITY, GROWTH_FACTOR * self.count_ids())
+            bloom = BloomFilter(capacity, self.error_rate)
+            for email_id in self.load_ids():
+                bloom.add(email_id)
+            self._bloom = bloom
+            self.counters["builds"] += 1
+        return self._bloom
+
+    def candidates(self, email_ids: list[str]) -> list[str]:
+        """IDs that may be processed; every other ID is definitely not."""
+        with self._lock:
+            bloom = self._ensure_built()
+            maybe = [email_id for email_id in email_ids if email_id in bloom]
+            self.counters["possible_positives"] += len(maybe)
+            self.counters["definite_negatives"] += len(email_ids) - len(maybe)
+            return maybe
+
+    def record_false_positives(self, count: int) -> None:
+        """Count possible positives the exact lookup did not find."""
+        with self._lock:
+            self.counters["false_positives"] += count
+
+    def add(self, email_ids: Iterable[str]) -> None:
+        """Add newly processed IDs (before the first build they load with the rest)."""
+        with self._lock:
+            if self._bloom is not None:
+                for email_id in email_ids:
+                    self._bloom.add(email_id)
+
+    def get_counters(self) -> dict:
+        """Return lookup counts with the filter's size and memory footprint."""
+        with self._lock:
+            bloom = self._bloom
+            return {
+                **self.counters,
+                "entries": bloom.count if bloom else 0,
+                "capacity": bloom.capacity if bloom else 0,
+                "hash_functions": bloom.num_hashes if bloom else 0,
+                "memory_bytes": bloom.memory_bytes() if bloom else 0,
+            }
@@ -0,0 +1,150 @@
+"""Client-side rate limiting and retry for Google and LLM API calls."""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from src.models.config import RateLimitConfig
+
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504, 529}
+# OpenAI/Anthropic SDK network errors, matched by name (the SDKs are imported lazily)
+SDK_CONNECTION_ERRORS = {"APIConnectionError", "APITimeoutError"}
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize bucket with a refill rate in tokens per second."""
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until the requested number of tokens is available."""
+        while (wait := self._try_take(tokens)) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """Wait without blocking the event loop until tokens are available."""
+        while (wait := self._try_take(tokens)) > 0:
+            await asyncio.sleep(wait)
+
+    def _try_take(self, tokens: float) -> float:
+        """Take tokens if available, otherwise return the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            # A cost above capacity goes once the bucket is full, leaving it in debt
+            if self.tokens >= min(tokens, self.capacity):
+                self.tokens -= tokens
+                return 0.0
+            return (min(tokens, self.capacity) - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Per-service token buckets with exponential backoff on throttling."""
+
+    def __init__(self, config: Optional[RateLimitConfig] = None):
+        """Initialize buckets from configuration."""
+        self.config = config or RateLimitConfig()
+        self.buckets = {
+            "gmail": TokenBucket(self.config.gmail_units_per_second),
+            "calendar": TokenBucket(self.config.calendar_requests_per_second),
+            "llm": TokenBucket(self.config.llm_requests_per_second),
+        }
+        self.counters = {name: {"throttles": 0, "retries": 0} for name in self.buckets}
+        self._lock = threading.Lock()
+
+    def call(
+        self, service: str, func: Callable[[], Any], cost: float = 1.0,
+        retries: Optional[int] = None,
+    ) -> Any:
+        """Call func under the service's quota, retrying throttles and 5xx errors.
+
+        retries overrides rate_limits.max_retries (0 makes a single attempt).
+        """
+        retries = self.config.max_retries if retries is None else retries
+        for attempt in range(retries + 1):
+            self.buckets[service].acquire(cost)
+            try:
+                return func()
+            except Exception as e:
+                time.sleep(self._retry_delay(service, attempt, e, retries))
+
+    async def call_async(
+        self, service: str, func: Callable[[], Awaitable[Any]], cost: float = 1.0,
+        retries: Optional[int] = None,
+    ) -> Any:
+        """Async variant of call for coroutine-based clients."""
+        retries = self.config.max_retries if retries is None else retries
+        for attempt in range(retries + 1):
+            await self.buckets[service].acquire_async(cost)
+            try:
+                return await func()
+            except Exception as e:
+                await asyncio.sleep(self._retry_delay(service, attempt, e, retries))
+
+    def execute(self, service: str, request, cost: float = 1.0) -> Any:
+        """Execute a Google API request under the service's quota."""
+        return self.call(service, request.execute, cost)
+
+    def get_counters(self) -> dict:
+        """Return a snapshot of throttle and retry counters per service."""
+        with self._lock:
+            return {name: dict(values) for name, values in self.counters.items()}
+
+    def _retry_delay(self, service: str, attempt: int, error: Exception, retries: int) -> float:
+        """Return the backoff before retrying, re-raising errors that are final."""
+        status, retry_after = _classify_error(error)
+        if status is None or attempt == retries:
+            raise error
+        self._count(service, throttled=status in (403, 429))
+        return self._backoff(attempt, retry_after)
+
+    def _count(self, service: str, throttled: bool) -> None:
+        """Record a retry, and a throttle if the server asked us to slow down."""
+        with self._lock:
+            self.counters[service]["retries"] += 1
+            if throttled:
+                self.counters[service]["throttles"] += 1
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        """Delay before the next attempt: Retry-After if given, else full jitter."""
+        if retry_after is not None:
+            return min(retry_after, self.config.max_delay_seconds)
+        ceiling = min(self.config.max_delay_seconds, self.config.base_delay_seconds * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+
+def _classify_error(error: Exception) -> tuple[Optional[int], Optional[float]]:
+    """Return (status, retry_after) for retryable errors, (None, None) otherwise."""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return 0, None
+    if any(cls.__name__ in SDK_CONNECTION_ERRORS for cls in type(error).__mro__):
+        return 0, None
+
+    # googleapiclient exposes .resp, the OpenAI and Anthropic SDKs .response
+    resp = getattr(error, "resp", None)
+    response = getattr(error, "response", None)
+    status = getattr(resp, "status", None) or getattr(error, "status_code", None)
+    headers = resp if resp is not None else getattr(response, "headers", None) or {}
+
+    rate_limited_403 = status == 403 and "ratelimitexceeded" in str(error).lower()
+    if status not in RETRYABLE_STATUSES and not rate_limited_403:
+        return None, None
+
+    return status, _parse_retry_after(headers.get("retry-after"))
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds."""
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,130 @@
+"""Retention of processed emails: archival, ID tombstones and space reclamation."""
+
+import json
+import time
+import zlib
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+from src.utils.sqlite_db import SQLiteDatabase
+from src.utils.storage_schema import migrate
+
+# Free pages returned to the filesystem per incremental VACUUM step
+VACUUM_STEP_PAGES = 256
+INCREMENTAL = 2  # PRAGMA auto_vacuum value
+
+ARCHIVE_COLUMNS = (
+    "email_id", "email_subject", "email_sender", "processed_at", "meeting_created", "failure_reason"
+)
+
+
+class RetentionManager(SQLiteDatabase):
+    """Moves processed emails past the retention horizon out of the hot table.
+
+    Each batch of expired rows becomes one zlib-compressed JSON blob in
+    processed_archive, and only the email ID stays behind in
+    processed_tombstones so the email still counts as processed. Summary
+    counters keep the archived emails. Freed pages are returned to the
+    filesystem by incremental VACUUM.
+    """
+
+    def __init__(self, db_path: str, retention_days: int = 0, batch_size: int = 1000):
+        """Initialize manager; retention_days of 0 keeps every row in the hot table."""
+        super().__init__(db_path)
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        with self.transaction():
+            migrate(self._conn)
+
+    def archive_batch(self, now: Optional[datetime] = None) -> int:
+        """Archive up to batch_size expired rows and return how many were moved."""
+        if self.retention_days <= 0:
+            return 0
+        cutoff = ((now or datetime.utcnow()) - timedelta(days=self.retention_days)).isoformat()
+        with self.transaction():
+            rows = self._fetchall(
+                f"SELECT {', '.join(ARCHIVE_COLUMNS)} FROM processed_emails "
+                "WHERE processed_at < ? ORDER BY processed_at LIMIT ?",
+                (cutoff, self.batch_size)
+            )
+            if not rows:
+                return 0
+            self._conn.execute(
+                """
+                INSERT INTO processed_archive
+                (archived_at, first_processed_at, last_processed_at, row_count, payload)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (datetime.utcnow().isoformat(), rows[0][3], rows[-1][3], len(rows),
+                 zlib.compress(json.dumps(rows).encode("utf-8")))
+            )
+            ids = [(row[0],) for row in rows]
+            self._conn.executemany("INSERT OR IGNORE INTO processed_tombstones (email_id) VALUES (?)", ids)
+            self._conn.executemany("DELETE FROM processed_emails WHERE email_id = ?", ids)
+            # Archived emails are never processed again, so their near-duplicate entries go too
+            self._conn.executemany("DELETE FROM near_dup_signatures WHERE email_id = ?", ids)
+            self._conn.executemany("DELETE FROM near_dup_buckets WHERE email_id = ?", ids)
+        return len(rows)
+
+    def iter_archived(self) -> Iterator[dict]:
+        """Yield archived rows as dicts keyed by ARCHIVE_COLUMNS, oldest batch first."""
+        for (payload,) in self._fetchall("SELECT payload FROM processed_archive ORDER BY id"):
+            for row in json.loads(zlib.decompress(payload)):
+                yield dict(zip(ARCHIVE_COLUMNS, row))
+
+    def reclaim(self, pages: int = VACUUM_STEP_PAGES) -> int:
+        """Return up to pages free pages to the filesystem and the bytes reclaimed."""
+        with self._lock:
+            if self._pragma("auto_vacuum") != INCREMENTAL:
+                return 0
+            before = self._pragma("freelist_count")
+            self._conn.execute(f"PRAGMA incremental_vacuum({int(pages)})").fetchall()
+            return (before - self._pragma("freelist_count")) * self._pragma("page_size")
+
+    def checkpoint(self) -> None:
+        """Copy the WAL into the database file and truncate it, so freed space shows on disk."""
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+    def enable_incremental_vacuum(self) -> bool:
+        """Convert a database created without incremental auto-vacuum (one full VACUUM)."""
+        with self._lock:
+            if self._pragma("auto_vacuum") == INCREMENTAL:
+                return False
+            self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            self._conn.execute("VACUUM")
+            return True
+
+    def maintain(self, budget_seconds: float) -> dict:
+        """Archive and reclaim in small steps until done or the time budget is spent."""
+        deadline = time.monotonic() + budget_seconds
+        result = {"archived": 0, "bytes_reclaimed": 0}
+        while time.monotonic() < deadline:
+            archived = self.archive_batch()
+            reclaimed = self.reclaim()
+            result["archived"] += archived
+            result["bytes_reclaimed"] += reclaimed
+            if not archived and not reclaimed:
+                break
+        return result
+
+    def space_report(self) -> dict:
+        """Database and free-space size, with row counts per retention table."""
+        page_size = self._pragma("page_size")
+        archived_rows, archive_bytes = self._fetchone(
+            "SELECT COALESCE(SUM(row_count), 0), COALESCE(SUM(LENGTH(payload)), 0) "
+            "FROM processed_archive"
+        )
+        return {
+            "file_bytes": self._pragma("page_count") * page_size,
+            "free_bytes": self._pragma("freelist_count") * page_size,
+            "incremental_vacuum": self._pragma("auto_vacuum") == INCREMENTAL,
+            "hot_rows": self._fetchone("SELECT COUNT(*) FROM processed_emails")[0],
+            "tombstones": self._fetchone("SELECT COUNT(*) FROM processed_tombstones")[0],
+            "archived_rows": archived_rows,
+            "archive_bytes": archive_bytes,
+        }
+
+    def _pragma(self, name: str) -> int:
+        """Value of an integer PRAGMA."""
+        return self._fetchone(f"PRAGMA {name}")[0]
@@ -0,0 +1,94 @@
+"""Shared SQLite connection handling for the storage classes."""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+# WAL lets readers (cli stats/report) run alongside the agent; NORMAL
+# synchronous only fsyncs at checkpoints, which WAL keeps crash-safe.
+PRAGMAS = (
+    # Only takes effect on a new database (see RetentionManager)
+    "PRAGMA auto_vacuum=INCREMENTAL",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-8000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Values per IN (...) query, well under SQLite's bound-parameter limit
+MAX_QUERY_IDS = 500
+
+
+class SQLiteDatabase:
+    """A long-lived, tuned connection shared by all calls under a lock.
+
+    Statements stay prepared in the connection's statement cache. Each
+    write commits on its own unless it runs inside transaction().
+    """
+
+    def __init__(self, db_path: str):
+        """Open the shared connection with the tuning pragmas applied."""
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._depth = 0
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=64)
+        for pragma in PRAGMAS:
+            self._conn.execute(pragma)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into one commit, rolling them back on error.
+
+        Nested scopes join the outermost one, and other threads wait until
+        it ends.
+        """
+        with self._lock:
+            self._depth += 1
+            try:
+                yield
+            except BaseException:
+                if self._depth == 1:
+                    self._conn.rollback()
+                raise
+            else:
+                if self._depth == 1:
+                    self._conn.commit()
+            finally:
+                self._depth -= 1
+
+    def _fetchone(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        """Run a query and return its first row."""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def _fetchall(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a query and return all its rows."""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _fetch_in(self, sql: str, values: list) -> list[tuple]:
+        """Run a query whose {placeholders} take values, in chunks of MAX_QUERY_IDS."""
+        rows = []
+        for start in range(0, len(values), MAX_QUERY_IDS):
+            chunk = values[start:start + MAX_QUERY_IDS]
+            rows += self._fetchall(sql.format(placeholders=", ".join("?" * len(chunk))), tuple(chunk))
+        return rows
+
+    def _write(self, sql: str, params: tuple = ()) -> None:
+        """Run a write, committing now unless inside a transaction scope."""
+        with self.transaction():
+            self._conn.execute(sql, params)
+
+    def _write_many(self, sql: str, rows: Iterable[tuple]) -> None:
+        """Run a write for many rows with executemany, in one commit."""
+        with self.transaction():
+            self._conn.executemany(sql, rows)
+
+    def close(self) -> None:
+        """Close the shared connection."""
+        with self._lock:
+            self._conn.close()
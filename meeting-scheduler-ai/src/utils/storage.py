@@ -1,54 +1,105 @@
 """Storage utilities for tracking processed emails."""
 
-import sqlite3
-from pathlib import Path
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Iterable, Iterator, NamedTuple, Optional
 
+from src.utils.processed_index import ProcessedIdIndex
+from src.utils.sqlite_db import SQLiteDatabase
+from src.utils.storage_schema import INSERT_PROCESSED, migrate
+from src.utils.storage_summary import read_summary, update_summary
 
-class EmailStorage:
-    """SQLite-based storage for tracking processed emails."""
 
-    def __init__(self, db_path: str):
-        """Initialize storage with database path."""
-        self.db_path = db_path
+class ProcessedRecord(NamedTuple):
+    """Outcome of processing one email, as stored by mark_many."""
+
+    email_id: str
+    meeting_created: bool
+    email_subject: str = ""
+    email_sender: str = ""
+    failure_reason: Optional[str] = None
+
+
+class EmailStorage(SQLiteDatabase):
+    """SQLite-based storage for tracking processed emails.
+
+    Inside deferred_writes(), processed records are queued in memory and
+    written together when the scope ends. With a bloom_error_rate, lookups
+    go through a ProcessedIdIndex first.
+    """
+
+    def __init__(self, db_path: str, bloom_error_rate: Optional[float] = None):
+        """Initialize storage with database path and optional Bloom filter index."""
+        super().__init__(db_path)
+        self._deferred: Optional[dict[str, tuple]] = None
         self._ensure_database_exists()
+        self.index = ProcessedIdIndex(
+            self._processed_ids,
+            lambda: self.get_stats()["total_processed"],
+            bloom_error_rate,
+        ) if bloom_error_rate else None
 
     def _ensure_database_exists(self) -> None:
-        """Create database and tables if they don't exist."""
-        db_file = Path(self.db_path)
-        db_file.parent.mkdir(parents=True, exist_ok=True)
-
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS processed_emails (
-                email_id TEXT PRIMARY KEY,
-                email_subject TEXT,
-                email_sender TEXT,
-                processed_at TEXT NOT NULL,
-                meeting_created INTEGER NOT NULL,
-                failure_reason TEXT
+        """Create database and tables, or migrate them to the current schema."""
+        with self.transaction():
+            self.schema_version = migrate(self._conn)
+
+    @contextmanager
+    def deferred_writes(self) -> Iterator[None]:
+        """Queue processed records and write them with one executemany at exit.
+
+        Queued records count as processed for lookups, and are written even
+        when the scope exits with an error. Nested scopes join the outer one.
+        """
+        if self._deferred is not None:
+            yield
+            return
+        self._deferred = {}
+        try:
+            yield
+        finally:
+            with self._lock:
+                rows, self._deferred = list(self._deferred.values()), None
+            self._insert_processed(rows)
+
+    def _insert_processed(self, rows: list[tuple]) -> None:
+        """Write processed rows, updating the summary counters and the index."""
+        rows = list({row[0]: row for row in rows}.values())
+        if not rows:
+            return
+        with self.transaction():
+            replaced = self._fetch_in(
+                "SELECT processed_at, meeting_created, failure_reason FROM processed_emails "
+                "WHERE email_id IN ({placeholders})", [row[0] for row in rows]
             )
-        """)
+            self._conn.executemany(INSERT_PROCESSED, rows)
+            update_summary(self._conn, (row[3:] for row in rows), replaced)
+        if self.index:
+            self.index.add(row[0] for row in rows)
 
-        conn.commit()
-        conn.close()
+    def _processed_ids(self) -> Iterator[str]:
+        """Stream every stored processed ID (for building the index)."""
+        with self._lock:
+            for (email_id,) in self._conn.execute("SELECT email_id FROM known_email_ids"):
+                yield email_id
 
     def is_processed(self, email_id: str) -> bool:
         """Check if an email has already been processed."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "SELECT 1 FROM processed_emails WHERE email_id = ?",
-            (email_id,)
-        )
-
-        result = cursor.fetchone()
-        conn.close()
-
-        return result is not None
+        return not self.filter_unprocessed([email_id])
+
+    def filter_unprocessed(self, email_ids: Iterable[str]) -> list[str]:
+        """Return the IDs not yet processed, in input order, without duplicates."""
+        email_ids = list(dict.fromkeys(email_ids))
+        with self._lock:
+            processed = set(self._deferred or ())
+        candidates = self.index.candidates(email_ids) if self.index else email_ids
+        found = {row[0] for row in self._fetch_in(
+            "SELECT email_id FROM known_email_ids WHERE email_id IN ({placeholders})", candidates
+        )}
+        if self.index:
+            self.index.record_false_positives(len(set(candidates) - found - processed))
+        processed |= found
+        return [email_id for email_id in email_ids if email_id not in processed]
 
     def mark_as_processed(
         self,
@@ -59,38 +110,41 @@ class EmailStorage:
         failure_reason: str = None
     ) -> None:
         """Mark an email as processed."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO processed_emails
-            (email_id, email_subject, email_sender, processed_at, meeting_created, failure_reason)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (email_id, email_subject, email_sender, datetime.utcnow().isoformat(),
-             int(meeting_created), failure_reason)
-        )
-
-        conn.commit()
-        conn.close()
+        self.mark_many([
+            ProcessedRecord(email_id, meeting_created, email_subject, email_sender, failure_reason)
+        ])
+
+    def mark_many(self, records: Iterable[ProcessedRecord], deferrable: bool = True) -> None:
+        """Mark many emails as processed in one transaction (or queue them if deferred)."""
+        processed_at = datetime.utcnow().isoformat()
+        rows = [
+            (r.email_id, r.email_subject, r.email_sender, processed_at,
+             int(r.meeting_created), r.failure_reason)
+            for r in records
+        ]
+        with self._lock:
+            if deferrable and self._deferred is not None:
+                self._deferred.update((row[0], row) for row in rows)
+                return
+        self._insert_processed(rows)
 
     def get_stats(self) -> dict:
-        """Get processing statistics."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) FROM processed_emails")
-        total = cursor.fetchone()[0]
-
-        cursor.execute(
-            "SELECT COUNT(*) FROM processed_emails WHERE meeting_created = 1"
+        """Get processing statistics: totals, per day and per failure reason.
+
+        Read from the summary counters, so the cost does not grow with the
+        number of processed emails.
+        """
+        with self._lock:
+            return read_summary(self._conn)
+
+    def get_sync_state(self, key: str) -> Optional[str]:
+        """Get a stored sync checkpoint value."""
+        row = self._fetchone("SELECT value FROM sync_state WHERE key = ?", (key,))
+        return row[0] if row else None
+
+    def set_sync_state(self, key: str, value: str) -> None:
+        """Store a sync checkpoint value."""
+        self._write(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+            (key, value)
         )
-        meetings_created = cursor.fetchone()[0]
-
-        conn.close()
-
-        return {
-            "total_processed": total,
-            "meetings_created": meetings_created,
-        }
@@ -0,0 +1,141 @@
+"""Versioned schema migrations and statements for the processed-email tables."""
+
+import sqlite3
+from datetime import datetime
+
+from src.utils.storage_summary import backfill_summary
+
+# Applied in order; the position in the list (from 1) is the schema version.
+# Steps are SQL statements or callables taking the connection, and must be
+# safe to re-run in case an earlier attempt stopped part way.
+MIGRATIONS = [
+    # 1: tables of the original schema
+    (
+        """
+        CREATE TABLE IF NOT EXISTS processed_emails (
+            email_id TEXT PRIMARY KEY,
+            email_subject TEXT,
+            email_sender TEXT,
+            processed_at TEXT NOT NULL,
+            meeting_created INTEGER NOT NULL,
+            failure_reason TEXT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS sync_state (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        """,
+    ),
+    # 2: indexes for the report's ordering and meeting filters
+    (
+        "CREATE INDEX IF NOT EXISTS idx_processed_emails_processed_at "
+        "ON processed_emails (processed_at)",
+        "CREATE INDEX IF NOT EXISTS idx_processed_emails_meeting_created "
+        "ON processed_emails (meeting_created)",
+    ),
+    # 3: summary counters per day, outcome and failure reason
+    (
+        """
+        CREATE TABLE IF NOT EXISTS processed_summary (
+            day TEXT NOT NULL,
+            meeting_created INTEGER NOT NULL,
+            reason TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (day, meeting_created, reason)
+        )
+        """,
+        backfill_summary,
+    ),
+    # 4: retention: ID tombstones of archived rows, compressed archive batches,
+    # and every known ID (hot or archived) for processed-checks
+    (
+        "CREATE TABLE IF NOT EXISTS processed_tombstones (email_id TEXT PRIMARY KEY) WITHOUT ROWID",
+        """
+        CREATE TABLE IF NOT EXISTS processed_archive (
+            id INTEGER PRIMARY KEY,
+            archived_at TEXT NOT NULL,
+            first_processed_at TEXT NOT NULL,
+            last_processed_at TEXT NOT NULL,
+            row_count INTEGER NOT NULL,
+            payload BLOB NOT NULL
+        )
+        """,
+        """
+        CREATE VIEW IF NOT EXISTS known_email_ids AS
+        SELECT email_id FROM processed_emails
+        UNION ALL SELECT email_id FROM processed_tombstones
+        """,
+    ),
+    # 5: near-duplicate index (MinHash signatures and LSH buckets), with an
+    # email_id index so retention can prune the buckets of archived emails
+    (
+        """
+        CREATE TABLE IF NOT EXISTS near_dup_signatures (
+            email_id TEXT PRIMARY KEY,
+            signature BLOB NOT NULL,
+            schedule TEXT NOT NULL,
+            added_at REAL NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS near_dup_buckets (
+            band INTEGER NOT NULL,
+            bucket INTEGER NOT NULL,
+            email_id TEXT NOT NULL,
+            PRIMARY KEY (band, bucket, email_id)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_near_dup_buckets_email_id ON near_dup_buckets (email_id)",
+    ),
+    # 6: calendar mirror (synced events and each calendar's sync token)
+    (
+        """
+        CREATE TABLE IF NOT EXISTS calendar_events (
+            calendar_id TEXT NOT NULL,
+            event_id TEXT NOT NULL,
+            summary TEXT,
+            start_utc TEXT NOT NULL,
+            end_utc TEXT NOT NULL,
+            PRIMARY KEY (calendar_id, event_id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_calendar_events_start "
+        "ON calendar_events (calendar_id, start_utc)",
+        """
+        CREATE TABLE IF NOT EXISTS calendar_sync (
+            calendar_id TEXT PRIMARY KEY,
+            sync_token TEXT NOT NULL
+        )
+        """,
+    ),
+]
+
+INSERT_PROCESSED = """
+    INSERT OR REPLACE INTO processed_emails
+    (email_id, email_subject, email_sender, processed_at, meeting_created, failure_reason)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """Apply pending migrations and return the resulting schema version."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            applied_at TEXT NOT NULL
+        )
+    """)
+    current = conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations").fetchone()[0]
+    for version, steps in enumerate(MIGRATIONS[current:], current + 1):
+        for step in steps:
+            if callable(step):
+                step(conn)
+            else:
+                conn.execute(step)
+        conn.execute(
+            "INSERT INTO schema_migrations (version, applied_at) VALUES (?, ?)",
+            (version, datetime.utcnow().isoformat())
+        )
+    return max(current, len(MIGRATIONS))
@@ -0,0 +1,65 @@
+"""Summary counters of processed emails, kept in step with every write."""
+
+import re
+import sqlite3
+from collections import Counter
+from typing import Iterable, Optional
+
+# Per-email detail in failure reasons ("(score 0.31)", "of email 18c2..."),
+# dropped so reasons group into a small set of categories
+REASON_DETAIL = re.compile(r"\s*\([^)]*\d[^)]*\)$| of email \S+$")
+
+UPSERT_SUMMARY = """
+    INSERT INTO processed_summary (day, meeting_created, reason, count) VALUES (?, ?, ?, ?)
+    ON CONFLICT (day, meeting_created, reason) DO UPDATE SET count = count + excluded.count
+"""
+
+
+def reason_category(reason: Optional[str]) -> str:
+    """Failure reason without its per-email detail ("" for none)."""
+    return REASON_DETAIL.sub("", reason) if reason else ""
+
+
+def update_summary(
+    conn: sqlite3.Connection, added: Iterable[tuple], removed: Iterable[tuple] = ()
+) -> None:
+    """Apply added and removed (processed_at, meeting_created, failure_reason) rows."""
+    deltas: Counter = Counter()
+    for rows, sign in ((added, 1), (removed, -1)):
+        for processed_at, meeting_created, failure_reason in rows:
+            deltas[(processed_at[:10], int(meeting_created), reason_category(failure_reason))] += sign
+    conn.executemany(
+        UPSERT_SUMMARY, [(*key, delta) for key, delta in deltas.items() if delta]
+    )
+
+
+def backfill_summary(conn: sqlite3.Connection) -> None:
+    """Rebuild the counters from the stored rows."""
+    conn.execute("DELETE FROM processed_summary")
+    update_summary(conn, conn.execute(
+        "SELECT processed_at, meeting_created, failure_reason FROM processed_emails"
+    ))
+
+
+def read_summary(conn: sqlite3.Connection) -> dict:
+    """Totals, per-day counts and failure counts per reason from the counters."""
+    totals = {"total_processed": 0, "meetings_created": 0}
+    per_day: dict[str, dict] = {}
+    failure_reasons: Counter = Counter()
+    rows = conn.execute(
+        "SELECT day, meeting_created, reason, count FROM processed_summary WHERE count != 0"
+    )
+    for day, meeting_created, reason, count in rows:
+        day_counts = per_day.setdefault(day, {"processed": 0, "meetings_created": 0})
+        day_counts["processed"] += count
+        totals["total_processed"] += count
+        if meeting_created:
+            day_counts["meetings_created"] += count
+            totals["meetings_created"] += count
+        else:
+            failure_reasons[reason or "Unknown"] += count
+    return {
+        **totals,
+        "per_day": dict(sorted(per_day.items())),
+        "failure_reasons": dict(failure_reasons.most_common()),
+    }
@@ -0,0 +1,9 @@
+"""Rough token accounting for prompt and body budgets."""
+
+# Rough characters-per-token ratio used to keep prompts under the budget
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the token count of a piece of text."""
+    return len(text) // CHARS_PER_TOKEN + 1
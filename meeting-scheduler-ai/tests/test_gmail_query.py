@@ -0,0 +1,83 @@
+"""The compiled Gmail query must never exclude mail the local filter accepts."""
+
+import re
+
+import pytest
+
+from src.models.config import GmailFilters
+from src.models.email import Email
+from src.utils.email_filter import filter_emails
+from src.utils.gmail_query import compile_gmail_query
+
+EMAILS = [
+    Email("1", "alice@example.com", "Team sync tomorrow", "", "", ["INBOX"], False),
+    Email("2", "Bob <bob@example.com>", "Async review", "", "", ["INBOX", "Work"], True),
+    Email("3", "carol@other.org", "Lunch?", "", "", ["Work"], False),
+    Email("4", "dave@example.com", "Re: Meeting notes", "", "", [], True),
+    Email("5", "eve@other.org", "MEETING request", "", "", ["INBOX"], False),
+]
+
+FILTERS = [
+    GmailFilters(),
+    GmailFilters(senders=["@example.com"]),
+    GmailFilters(senders=["alice@example.com", "carol@other.org"]),
+    GmailFilters(subject_keywords=["sync"]),
+    GmailFilters(subject_keywords=["meeting", "lunch"]),
+    GmailFilters(labels=["Work"]),
+    GmailFilters(labels=["INBOX", "Work"]),
+    GmailFilters(read_status="unread"),
+    GmailFilters(read_status="read"),
+    GmailFilters(senders=["@example.com"], subject_keywords=["sync"], read_status="unread"),
+]
+
+
+def _address(sender: str) -> str:
+    """Address part of a From header."""
+    match = re.search(r"<([^>]+)>", sender)
+    return (match.group(1) if match else sender).lower()
+
+
+def _gmail_matches(params: dict, email: Email) -> bool:
+    """Evaluate the compiled parameters the way Gmail search would."""
+    if any(label not in email.labels for label in params.get("labelIds", [])):
+        return False
+    for clause in re.findall(r"\{[^}]*\}|\S+", params.get("q", "")):
+        terms = clause.strip("{}").split()
+        if not any(_term_matches(term, email) for term in terms):
+            return False
+    return True
+
+
+def _term_matches(term: str, email: Email) -> bool:
+    """One search term: from:, subject: (whole words), is:unread or -is:unread."""
+    if term == "is:unread":
+        return not email.is_read
+    if term == "-is:unread":
+        return email.is_read
+    operator, _, value = term.partition(":")
+    value = value.strip('"').lower()
+    if operator == "subject":
+        return re.search(rf"\b{re.escape(value)}\b", email.subject, re.IGNORECASE) is not None
+    assert operator == "from", f"unexpected operator in {term}"
+    address = _address(email.sender)
+    return address.endswith(value) if value.startswith("@") else address == value
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_query_keeps_every_locally_matching_email(filters):
+    params = compile_gmail_query(filters)
+    fetched = [email for email in EMAILS if _gmail_matches(params, email)]
+    assert filter_emails(fetched, filters) == filter_emails(EMAILS, filters)
+
+
+def test_subject_keywords_are_not_pushed_down():
+    params = compile_gmail_query(GmailFilters(subject_keywords=["sync"]))
+    assert "subject:" not in params.get("q", "")
+
+
+def test_multiple_labels_are_not_pushed_down():
+    assert "labelIds" not in compile_gmail_query(GmailFilters(labels=["INBOX", "Work"]))
+
+
+def test_no_filters_compile_to_no_parameters():
+    assert compile_gmail_query(GmailFilters()) == {}
@@ -0,0 +1,111 @@
+"""Attached invites: zones, recurrence, all-day events and cancellations."""
+
+from datetime import datetime
+
+from src.models.email import Email
+from src.services.ics_parser import read_invites
+
+
+def _invite(*event_lines: str, method: str = "REQUEST", before: tuple = ()) -> str:
+    """A calendar with one VEVENT holding event_lines, after any other components."""
+    return "\r\n".join([
+        "BEGIN:VCALENDAR", f"METHOD:{method}", *before,
+        "BEGIN:VEVENT", "UID:1@example.com", "SUMMARY:Planning", *event_lines, "END:VEVENT",
+        "END:VCALENDAR",
+    ])
+
+
+def _read(calendar_data: str):
+    """The meeting read from one email's invite (None for a cancellation)."""
+    email = Email("1", "a@example.com", "Invite", "", "", ["INBOX"], False,
+                  calendar_data=calendar_data)
+    return read_invites([email], default_duration=30)["1"]
+
+
+def test_iana_tzid_is_converted_to_utc_and_kept():
+    meeting = _read(_invite(
+        "DTSTART;TZID=America/New_York:20260115T100000",
+        "DTEND;TZID=America/New_York:20260115T110000",
+    ))
+    assert meeting.start_datetime == datetime(2026, 1, 15, 15, 0)
+    assert meeting.end_datetime == datetime(2026, 1, 15, 16, 0)
+    assert meeting.time_zone == "America/New_York"
+
+
+def test_windows_zone_name_is_mapped_to_iana():
+    meeting = _read(_invite('DTSTART;TZID="Pacific Standard Time":20260715T100000'))
+    # PDT in July: UTC-7
+    assert meeting.start_datetime == datetime(2026, 7, 15, 17, 0)
+    assert meeting.time_zone == "America/Los_Angeles"
+    assert meeting.to_calendar_event()["start"] == {
+        "dateTime": "2026-07-15T10:00:00", "timeZone": "America/Los_Angeles"
+    }
+
+
+def test_unknown_tzid_falls_back_to_vtimezone_standard_offset():
+    zone = (
+        "BEGIN:VTIMEZONE", "TZID:Custom Zone",
+        "BEGIN:DAYLIGHT", "TZOFFSETTO:+0300", "END:DAYLIGHT",
+        "BEGIN:STANDARD", "TZOFFSETTO:+0200", "END:STANDARD",
+        "END:VTIMEZONE",
+    )
+    meeting = _read(_invite("DTSTART;TZID=Custom Zone:20260115T100000", before=zone))
+    assert meeting.start_datetime == datetime(2026, 1, 15, 8, 0)
+    assert meeting.time_zone is None
+
+
+def test_missing_end_uses_duration_or_default():
+    with_duration = _read(_invite("DTSTART:20260115T100000Z", "DURATION:PT1H30M"))
+    assert with_duration.end_datetime == datetime(2026, 1, 15, 11, 30)
+    without = _read(_invite("DTSTART:20260115T100000Z"))
+    assert without.end_datetime == datetime(2026, 1, 15, 10, 30)
+
+
+def test_rrule_is_kept_and_overrides_are_skipped():
+    meeting = _read("\r\n".join([
+        "BEGIN:VCALENDAR",
+        "BEGIN:VEVENT", "SUMMARY:Moved occurrence", "RECURRENCE-ID:20260122T100000Z",
+        "DTSTART:20260122T140000Z", "END:VEVENT",
+        "BEGIN:VEVENT", "SUMMARY:Weekly sync", "DTSTART:20260115T100000Z",
+        "RRULE:FREQ=WEEKLY;BYDAY=TH", "EXDATE:20260129T100000Z", "END:VEVENT",
+        "END:VCALENDAR",
+    ]))
+    assert meeting.subject == "Weekly sync"
+    assert meeting.recurrence == ["RRULE:FREQ=WEEKLY;BYDAY=TH", "EXDATE:20260129T100000Z"]
+    assert meeting.to_calendar_event()["recurrence"] == meeting.recurrence
+
+
+def test_all_day_event_spans_one_day_by_default():
+    meeting = _read(_invite("DTSTART;VALUE=DATE:20260115"))
+    assert meeting.all_day
+    assert meeting.end_datetime == datetime(2026, 1, 16)
+    event = meeting.to_calendar_event()
+    assert event["start"] == {"date": "2026-01-15"}
+    assert event["end"] == {"date": "2026-01-16"}
+
+
+def test_folded_lines_are_joined():
+    meeting = _read(_invite(
+        "DTSTART:20260115T100000Z", "DESCRIPTION:Agenda: budget\\,", "  and hiring"
+    ))
+    assert meeting.description == "Agenda: budget, and hiring"
+
+
+def test_cancellations_are_marked_none():
+    emails = [
+        Email("cancel", "a@example.com", "", "", "", [], False,
+              calendar_data=_invite("DTSTART:20260115T100000Z", method="CANCEL")),
+        Email("status", "a@example.com", "", "", "", [], False,
+              calendar_data=_invite("DTSTART:20260115T100000Z", "STATUS:CANCELLED")),
+    ]
+    assert read_invites(emails, default_duration=30) == {"cancel": None, "status": None}
+
+
+def test_unparsable_invites_are_left_for_the_llm():
+    emails = [
+        Email("no-start", "a@example.com", "", "", "", [], False, calendar_data=_invite()),
+        Email("bad-date", "a@example.com", "", "", "", [], False,
+              calendar_data=_invite("DTSTART:2026-01-15")),
+        Email("plain", "a@example.com", "", "", "", [], False),
+    ]
+    assert read_invites(emails, default_duration=30) == {}
@@ -0,0 +1,66 @@
+"""Templated emails answered without the LLM, and free-form ones left to it."""
+
+from datetime import datetime
+
+import pytest
+
+from src.models.config import LLMConfig
+from src.services.llm_service import LLMService
+from src.services.rule_extractor import extract_templated
+
+TEMPLATED = """Hi team,
+
+Date: March 5, 2026
+Time: 2:30 PM
+Duration: 1.5 hours
+Location: Room 4
+"""
+
+
+class RefusingPool:
+    """Provider pool that fails the test if the LLM is asked."""
+
+    def complete(self, prompt: str, max_tokens: int = 0) -> str:
+        raise AssertionError("the provider should not be called")
+
+
+def test_labelled_fields_build_a_meeting():
+    meeting = extract_templated("Design review", TEMPLATED, 60)
+    assert meeting.subject == "Design review"
+    assert meeting.start_datetime == datetime(2026, 3, 5, 14, 30)
+    assert meeting.end_datetime == datetime(2026, 3, 5, 16, 0)
+    assert meeting.location == "Room 4"
+
+
+def test_when_line_and_default_duration():
+    meeting = extract_templated("Sync", "When: 2026-03-05 at 09:00\nWhere: Zoom", 45)
+    assert meeting.start_datetime == datetime(2026, 3, 5, 9, 0)
+    assert meeting.end_datetime == datetime(2026, 3, 5, 9, 45)
+    assert meeting.location == "Zoom"
+
+
+@pytest.mark.parametrize("body", [
+    "Can we meet sometime next week to go over the plan?",
+    "Date: March 5, 2026\nLet's pick a time later.",
+    "Date: March 5, 2026\nTime: 2pm\nDate: March 6, 2026",
+    "Date: March 5, 2026\nTime: 2pm\nDuration: a while",
+    "Date: March 5, 2026\nTime: 2pm\nDuration: 9000 hours",
+    "Date: 9999-12-31\nTime: 11:30 PM\nDuration: 90 minutes",
+    "Sounds good.\n\nOn Mon, Mar 2, 2026, Bob wrote:\nDate: March 5, 2026\nTime: 2pm",
+    "Sounds good.\n> Date: March 5, 2026\n> Time: 2pm",
+])
+def test_free_form_or_ambiguous_bodies_fall_through(body):
+    assert extract_templated("Sync", body, 60) is None
+
+
+def test_fast_path_answers_without_the_provider():
+    service = LLMService(LLMConfig(rule_fast_path=True), pool=RefusingPool())
+    meeting = service.extract_meeting_info("Design review", TEMPLATED)
+    assert meeting.start_datetime == datetime(2026, 3, 5, 14, 30)
+    assert service.paths == {"rules": 1, "cache": 0, "llm": 0}
+
+
+def test_fast_path_is_off_by_default():
+    service = LLMService(LLMConfig(), pool=RefusingPool())
+    with pytest.raises(AssertionError):
+        service.extract_meeting_info("Design review", TEMPLATED)
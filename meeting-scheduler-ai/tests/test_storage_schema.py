@@ -0,0 +1,75 @@
+"""Schema migrations, the summary backfill, and stats read from the counters."""
+
+import sqlite3
+
+from src.utils.storage import EmailStorage, ProcessedRecord
+from src.utils.storage_schema import MIGRATIONS, migrate
+
+LEGACY_ROWS = [
+    ("a", "Sync", "x@example.com", "2026-03-01T09:00:00", 1, None),
+    ("b", "Lunch", "y@example.com", "2026-03-01T10:00:00", 0, "No meeting found"),
+    ("c", "Hi", "z@example.com", "2026-03-02T08:00:00", 0, "Classified out (score 0.12)"),
+    ("d", "Hey", "z@example.com", "2026-03-02T08:30:00", 0, "Classified out (score 0.31)"),
+]
+
+
+def _legacy_database(path: str) -> None:
+    """A database written before migrations existed: the original tables only."""
+    conn = sqlite3.connect(path)
+    conn.execute(MIGRATIONS[0][0])
+    conn.execute(MIGRATIONS[0][1])
+    conn.executemany("INSERT INTO processed_emails VALUES (?, ?, ?, ?, ?, ?)", LEGACY_ROWS)
+    conn.commit()
+    conn.close()
+
+
+def test_legacy_database_is_migrated_and_backfilled(tmp_path):
+    path = str(tmp_path / "emails.db")
+    _legacy_database(path)
+
+    storage = EmailStorage(path)
+
+    assert storage.schema_version == len(MIGRATIONS)
+    assert storage.get_stats() == {
+        "total_processed": 4,
+        "meetings_created": 1,
+        "per_day": {
+            "2026-03-01": {"processed": 2, "meetings_created": 1},
+            "2026-03-02": {"processed": 2, "meetings_created": 0},
+        },
+        "failure_reasons": {"Classified out": 2, "No meeting found": 1},
+    }
+    assert storage.is_processed("c")
+
+
+def test_migrations_run_once(tmp_path):
+    path = str(tmp_path / "emails.db")
+    EmailStorage(path).close()
+
+    conn = sqlite3.connect(path)
+    assert migrate(conn) == len(MIGRATIONS)
+    versions = [row[0] for row in conn.execute("SELECT version FROM schema_migrations")]
+    assert versions == list(range(1, len(MIGRATIONS) + 1))
+
+
+def test_report_indexes_exist(tmp_path):
+    storage = EmailStorage(str(tmp_path / "emails.db"))
+    indexes = {row[0] for row in storage._fetchall(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'processed_emails'"
+    )}
+    assert {
+        "idx_processed_emails_processed_at", "idx_processed_emails_meeting_created"
+    } <= indexes
+
+
+def test_counters_follow_writes_and_replacements(tmp_path):
+    storage = EmailStorage(str(tmp_path / "emails.db"))
+    storage.mark_as_processed("a", False, failure_reason="No meeting found")
+    with storage.deferred_writes():
+        storage.mark_many([ProcessedRecord("b", True), ProcessedRecord("c", False)])
+    # Reprocessing an email replaces its outcome rather than counting it twice
+    storage.mark_as_processed("a", True)
+
+    stats = storage.get_stats()
+    assert (stats["total_processed"], stats["meetings_created"]) == (3, 2)
+    assert stats["failure_reasons"] == {"Unknown": 1}